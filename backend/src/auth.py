@@ -1,33 +1,68 @@
 """Authentication module for CleanDataPro"""
+import asyncio
 import bcrypt
+import hashlib
 import jwt
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 try:
-    from pymongo import MongoClient
+    from pymongo.errors import DuplicateKeyError
     PYMONGO_AVAILABLE = True
 except ImportError:
-    MongoClient = None
+    class DuplicateKeyError(Exception):  # type: ignore[no-redef]
+        """Stand-in so `except DuplicateKeyError` still works without pymongo"""
     PYMONGO_AVAILABLE = False
 
-# MongoDB connection (lazy-loaded)
-MONGODB_URI = os.getenv("MONGODB_URI")
-_client = None
-_db = None
+from .config import get_mongo_client, MONGODB_URI
+
+logger = logging.getLogger("cleandatapro.backend")
+
+# Users collection (lazy-loaded on the shared client from config)
 _users_collection = None
 
+# Recently verified (bcrypt hash, sha256 of password) pairs. Only successful
+# checks are cached, so wrong guesses still pay the full bcrypt cost.
+VERIFY_CACHE_TTL = 15.0
+_VERIFY_CACHE: Dict[Tuple[str, bytes], float] = {}
+_VERIFY_LOCK = threading.Lock()
+
+# Decoded tokens: token -> (cached until, email or None). FIFO-bounded.
+TOKEN_CACHE_TTL = 15.0
+TOKEN_CACHE_SIZE = 10_000
+_TOKEN_CACHE: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+_TOKEN_LOCK = threading.Lock()
+
 # JWT secret key
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = "HS256"
+# Encoded once here; PyJWT would otherwise re-encode the str key per call
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+
+# Default token lifetime in seconds (7 days)
+TOKEN_LIFETIME = 7 * 24 * 60 * 60
+
+# bcrypt cost factor (each +1 doubles hashing time)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# bcrypt releases the GIL, so hashing runs truly in parallel; one worker per
+# core keeps login bursts from oversubscribing the CPU
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
 
 
 def get_users_collection():
     """Get the users collection, initializing MongoDB connection if needed"""
-    global _client, _db, _users_collection
+    global _users_collection
     
-    if not PYMONGO_AVAILABLE or MongoClient is None:
+    if not PYMONGO_AVAILABLE:
         raise RuntimeError("pymongo is not installed")
     
     if not MONGODB_URI:
@@ -35,67 +70,168 @@ def get_users_collection():
     
     if _users_collection is None:
         try:
-            _client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000)
+            # Reuse the process-wide client instead of opening a second pool
+            client = get_mongo_client()
+            if client is None:
+                raise RuntimeError("MongoDB client unavailable")
             # Test the connection
-            _client.admin.command('ping')
-            _db = _client["cleandatapro"]
-            _users_collection = _db["users"]
+            client.admin.command('ping')
+            _users_collection = client["cleandatapro"]["users"]
+            _ensure_email_index(_users_collection)
         except Exception as e:
-            _client = None
-            _db = None
             _users_collection = None
             raise RuntimeError(f"Failed to connect to MongoDB: {str(e)}")
     
     return _users_collection
 
 
+def _ensure_email_index(users_collection) -> None:
+    """Index users by email so lookups don't scan the whole collection"""
+    try:
+        # No-op when the index already exists
+        users_collection.create_index("email", unique=True)
+    except Exception as e:
+        # e.g. existing duplicate emails; lookups still work, just unindexed
+        logger.warning(f"Could not create unique email index: {type(e).__name__}: {str(e)}")
+
+
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    # Runs on the calling thread; async code should use hash_password_async
     return bcrypt.hashpw(password.encode(), salt).decode()
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the bcrypt pool without blocking the event loop"""
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    loop = asyncio.get_running_loop()
+    hashed = await loop.run_in_executor(_BCRYPT_POOL, bcrypt.hashpw, password.encode(), salt)
+    return hashed.decode()
+
+
+def _verify_cache_key(password: str, hashed_password: str) -> Tuple[str, bytes]:
+    return (hashed_password, hashlib.sha256(password.encode()).digest())
+
+
+def _verified_recently(key: Tuple[str, bytes], now: float) -> bool:
+    with _VERIFY_LOCK:
+        verified_at = _VERIFY_CACHE.get(key)
+    return verified_at is not None and now - verified_at < VERIFY_CACHE_TTL
+
+
+def _remember_verified(key: Tuple[str, bytes], now: float) -> None:
+    with _VERIFY_LOCK:
+        # Drop expired entries so the cache only spans one TTL window
+        expired = [k for k, ts in _VERIFY_CACHE.items() if now - ts >= VERIFY_CACHE_TTL]
+        for k in expired:
+            del _VERIFY_CACHE[k]
+        _VERIFY_CACHE[key] = now
+
+
 def verify_password(password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return bcrypt.checkpw(password.encode(), hashed_password.encode())
+    key = _verify_cache_key(password, hashed_password)
+    now = time.monotonic()
+    if _verified_recently(key, now):
+        return True
+    
+    # Runs on the calling thread; async code should use verify_password_async
+    if not bcrypt.checkpw(password.encode(), hashed_password.encode()):
+        return False
+    
+    _remember_verified(key, now)
+    return True
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """Verify a password on the bcrypt pool without blocking the event loop"""
+    key = _verify_cache_key(password, hashed_password)
+    now = time.monotonic()
+    if _verified_recently(key, now):
+        return True
+    
+    loop = asyncio.get_running_loop()
+    checked = await loop.run_in_executor(
+        _BCRYPT_POOL, bcrypt.checkpw, password.encode(), hashed_password.encode()
+    )
+    if not checked:
+        return False
+    
+    _remember_verified(key, now)
+    return True
+
+
+def _needs_rehash(hashed_password: str) -> bool:
+    """Check if a stored hash was made with a cost other than BCRYPT_ROUNDS"""
+    # bcrypt hashes look like $2b$12$<salt><digest>
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return False
 
 
 def create_access_token(email: str, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
-    if expires_delta is None:
-        expires_delta = timedelta(days=7)
-    
-    expire = datetime.utcnow() + expires_delta
-    to_encode = {"email": email, "exp": expire}
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    lifetime = TOKEN_LIFETIME if expires_delta is None else int(expires_delta.total_seconds())
+    # PyJWT takes an integer exp as-is, no datetime round trip needed
+    to_encode = {"email": email, "exp": int(time.time()) + lifetime}
+    encoded_jwt = jwt.encode(to_encode, _SECRET_KEY_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """Extract the token from an `Authorization: Bearer <token>` header value"""
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    return authorization[7:].strip()
+
+
 def verify_token(token: str) -> Optional[str]:
     """Verify a JWT token and return email if valid"""
+    now = time.monotonic()
+    with _TOKEN_LOCK:
+        cached = _TOKEN_CACHE.get(token)
+    if cached is not None and now < cached[0]:
+        return cached[1]
+    
+    expires = now + TOKEN_CACHE_TTL
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("email")
-        if email is None:
-            return None
-        return email
+        payload = jwt.decode(token, _SECRET_KEY_BYTES, algorithms=[ALGORITHM])
+        email: Optional[str] = payload.get("email")
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            # Never serve a cached answer past the token's own expiry
+            expires = min(expires, now + (exp - time.time()))
     except jwt.InvalidTokenError:
-        return None
+        email = None
+    
+    with _TOKEN_LOCK:
+        _TOKEN_CACHE[token] = (expires, email)
+        _TOKEN_CACHE.move_to_end(token)
+        while len(_TOKEN_CACHE) > TOKEN_CACHE_SIZE:
+            _TOKEN_CACHE.popitem(last=False)
+    return email
+
 
+async def register_user(email: str, password: str, name: str = "") -> dict:
+    """Register a new user
 
-def register_user(email: str, password: str, name: str = "") -> dict:
-    """Register a new user"""
+    MongoDB calls run on the default executor and bcrypt on its own pool, so
+    the event loop is never blocked.
+    """
+    loop = asyncio.get_running_loop()
     try:
-        users_collection = get_users_collection()
+        users_collection = await loop.run_in_executor(None, get_users_collection)
     except RuntimeError as e:
         return {"success": False, "message": f"Database error: {str(e)}"}
     
     # Check if user exists
-    if users_collection.find_one({"email": email}):
+    if await loop.run_in_executor(None, users_collection.find_one, {"email": email}):
         return {"success": False, "message": "Email already registered"}
     
     # Hash password and create user
-    hashed_pwd = hash_password(password)
+    hashed_pwd = await hash_password_async(password)
     user_doc = {
         "email": email,
         "password": hashed_pwd,
@@ -104,7 +240,11 @@ def register_user(email: str, password: str, name: str = "") -> dict:
         "processing_count": 0
     }
     
-    users_collection.insert_one(user_doc)
+    try:
+        await loop.run_in_executor(None, users_collection.insert_one, user_doc)
+    except DuplicateKeyError:
+        # Lost a race with a concurrent registration for the same email
+        return {"success": False, "message": "Email already registered"}
     token = create_access_token(email)
     
     return {
@@ -116,21 +256,41 @@ def register_user(email: str, password: str, name: str = "") -> dict:
     }
 
 
-def login_user(email: str, password: str) -> dict:
-    """Login a user"""
+async def login_user(email: str, password: str) -> dict:
+    """Login a user
+
+    Like `register_user`, blocking work is handed off to executors.
+    """
+    loop = asyncio.get_running_loop()
     try:
-        users_collection = get_users_collection()
+        users_collection = await loop.run_in_executor(None, get_users_collection)
     except RuntimeError as e:
         return {"success": False, "message": f"Database error: {str(e)}"}
     
-    user = users_collection.find_one({"email": email})
+    user = await loop.run_in_executor(None, users_collection.find_one, {"email": email})
     
     if not user:
         return {"success": False, "message": "Invalid email or password"}
     
-    if not verify_password(password, user["password"]):
+    if not await verify_password_async(password, user["password"]):
         return {"success": False, "message": "Invalid email or password"}
     
+    if _needs_rehash(user["password"]):
+        # Migrate to the configured cost while the plain password is at hand,
+        # so lowering/raising BCRYPT_ROUNDS applies to existing users too
+        try:
+            rehashed = await hash_password_async(password)
+            await loop.run_in_executor(
+                None,
+                users_collection.update_one,
+                {"_id": user["_id"]},
+                {"$set": {"password": rehashed}},
+            )
+        except Exception:
+            # Login still succeeds on the old hash, but a broken
+            # BCRYPT_ROUNDS change shouldn't go unnoticed
+            logger.warning("Password rehash failed for %s", email, exc_info=True)
+    
     token = create_access_token(email)
     
     return {
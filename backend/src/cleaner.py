@@ -1,30 +1,50 @@
-from typing import Any, Dict, Tuple, Set
+from typing import Any, Callable, Dict, List, Optional, Tuple, Set
+from collections import Counter
 from pathlib import Path
 import pandas as pd
 import numpy as np
 
 
+def _converter_for(t: type) -> Callable[[Any], Any]:
+    """Pick the conversion for values of type `t` (subclasses included)."""
+    if issubclass(t, np.integer):
+        return int
+    elif issubclass(t, np.floating):
+        return float
+    elif issubclass(t, np.ndarray):
+        return np.ndarray.tolist
+    elif issubclass(t, dict):
+        return lambda obj: {k: _convert_numpy_types(v) for k, v in obj.items()}
+    elif issubclass(t, (list, tuple)):
+        return lambda obj: [_convert_numpy_types(item) for item in obj]
+    elif issubclass(t, pd.Series):
+        return pd.Series.to_list
+    elif issubclass(t, pd.DataFrame):
+        return lambda obj: obj.to_dict(orient="records")
+    else:
+        return _identity
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+# Converter per concrete type, resolved once so each value costs one dict lookup
+_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    t: _identity for t in (str, int, float, bool, type(None))
+}
+
+
 def _convert_numpy_types(obj: Any) -> Any:
     """Recursively convert numpy types to native Python types for JSON serialization."""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {k: _convert_numpy_types(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [_convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, pd.Series):
-        return obj.to_list()
-    elif isinstance(obj, pd.DataFrame):
-        return obj.to_dict(orient="records")
-    else:
-        return obj
+    t = type(obj)
+    convert = _CONVERTERS.get(t)
+    if convert is None:
+        convert = _CONVERTERS[t] = _converter_for(t)
+    return convert(obj)
 
 # Common placeholder values that should be treated as missing data
-PLACEHOLDER_VALUES = {
+PLACEHOLDER_VALUES = frozenset({
     "unknown",
     "n/a",
     "na",
@@ -41,7 +61,7 @@ PLACEHOLDER_VALUES = {
     "?",
     "n.a.",
     "#n/a",
-}
+})
 
 
 def _is_missing_value(val: Any) -> bool:
@@ -58,85 +78,122 @@ def _is_missing_value(val: Any) -> bool:
     return False
 
 
+def _can_hold_placeholders(s: pd.Series) -> bool:
+    """Placeholders are strings, so only text-like columns can contain them."""
+    return s.dtype == object or isinstance(s.dtype, (pd.CategoricalDtype, pd.StringDtype))
+
+
+def _missing_mask(s: pd.Series) -> pd.Series:
+    """Vectorized `_is_missing_value` over a whole column."""
+    mask = s.isna()
+    # Placeholders can only live in text (object/string/category) columns
+    if _can_hold_placeholders(s):
+        # Strip/lowercase each distinct value once rather than every row
+        codes, uniques = pd.factorize(s)
+        try:
+            lowered = pd.Series(uniques, dtype=object).str.strip().str.lower()
+        except AttributeError:
+            # .str refuses object columns without any strings in them
+            return mask
+        # Trailing False catches the -1 code factorize gives NaN
+        hits = np.append(lowered.isin(PLACEHOLDER_VALUES).to_numpy(), False)
+        mask |= hits[codes]
+    return mask
+
+
 def _is_numeric_column(s: pd.Series) -> bool:
     """Detect if a column should be numeric by checking non-missing values."""
-    non_missing = s[~s.apply(lambda x: _is_missing_value(x))]
+    non_missing = s[~_missing_mask(s)]
     
     if non_missing.empty:
         return False
     
-    # Try to convert to numeric
-    numeric_count = 0
-    for val in non_missing:
-        try:
-            float(val)
-            numeric_count += 1
-        except (ValueError, TypeError):
-            pass
+    # Try to convert to numeric (unparseable values become NaN)
+    numeric_ratio = pd.to_numeric(non_missing, errors="coerce").notna().mean()
     
     # If majority (>80%) of non-missing values are numeric, treat as numeric column
-    return numeric_count / len(non_missing) > 0.8 if non_missing.shape[0] > 0 else False
+    return bool(numeric_ratio > 0.8)
+
 
+def _replace_placeholders(
+    df: pd.DataFrame, masks: Optional[Dict[Any, pd.Series]] = None
+) -> pd.DataFrame:
+    """Replace placeholder values with actual NaN so they can be properly filled.
 
-def _replace_placeholders(df: pd.DataFrame) -> pd.DataFrame:
-    """Replace placeholder values with actual NaN so they can be properly filled."""
-    working = df.copy()
+    `masks` are the per-column missing masks from `_analyze_columns`; when
+    given they are reused instead of being recomputed. Columns without
+    placeholders are shared with `df` rather than copied, so treat the
+    result as read-only.
+    """
+    cols = {}
     
-    for col in working.columns:
-        s = working[col]
-        # Only process object (string) columns for placeholder replacement
-        if s.dtype == object:
+    for col, s in df.items():
+        # Only process text columns for placeholder replacement
+        if _can_hold_placeholders(s):
             # Replace placeholder strings with NaN
-            mask = s.apply(lambda x: _is_missing_value(x) if isinstance(x, str) else False)
-            working.loc[mask, col] = np.nan
+            mask = masks[col] if masks is not None else _missing_mask(s)
+            s = s.mask(mask)
+        cols[col] = s
     
-    return working
+    # Build the frame once instead of reassigning columns one by one
+    return pd.DataFrame(cols, index=df.index, copy=False)
 
 
-def analyze_missing_summary(df: pd.DataFrame, top_values: int = 3) -> pd.DataFrame:
-    """Return a DataFrame summarizing missing values and basic stats per column.
-    
-    Detects both actual NaN values and placeholder strings (UNKNOWN, ERROR, etc).
-    Also detects type inconsistencies in numeric columns.
+def _sample_values(non_missing: pd.Series, top_values: int) -> List[Any]:
+    """First `top_values` distinct values in order of appearance (compared as str)."""
+    # Distinct values usually show up early, so try a small window first and
+    # only dedupe the whole column when the window comes up short
+    for window in (non_missing.head(10 * top_values), non_missing):
+        firsts = window[~window.astype(str).duplicated()]
+        if len(firsts) >= top_values or len(window) == len(non_missing):
+            return firsts.head(top_values).tolist()
+    return []
+
+
+def _analyze_columns(
+    df: pd.DataFrame, top_values: int = 3
+) -> Tuple[pd.DataFrame, Dict[Any, pd.Series], Set[Any]]:
+    """Single pass behind `analyze_missing_summary`.
+
+    Besides the summary frame, returns the per-column missing masks and the
+    object columns that should be numeric, so `clean_dataframe` can reuse them
+    instead of scanning the data again.
     """
     total = len(df)
     rows = []
+    masks: Dict[Any, pd.Series] = {}
+    numeric_cols: Set[Any] = set()
 
     for col in df.columns:
         s = df[col]
         # Count both actual NaN and placeholder values
-        missing = int(s.apply(lambda x: _is_missing_value(x)).sum())
+        mask = _missing_mask(s)
+        masks[col] = mask
+        missing = int(mask.sum())
         missing_pct = round((missing / total) * 100, 2) if total else 0.0
         dtype = str(s.dtype)
         
-        # Count unique non-missing values
-        non_missing = s[~s.apply(lambda x: _is_missing_value(x))]
-        unique_count = int(non_missing.nunique())
+        # Count unique non-missing values. Factorizing (rather than nunique)
+        # also yields codes, so the numeric check below parses each distinct
+        # value once instead of every row.
+        non_missing = s[~mask]
+        codes, uniques = pd.factorize(non_missing)
+        unique_count = len(uniques)
 
         # ALSO: Detect type inconsistencies in columns that SHOULD be numeric
         type_issues = 0
-        if s.dtype == object and _is_numeric_column(s):
-            # This is a numeric column with type issues
-            # Count non-numeric values (excluding missing values already counted)
-            for val in non_missing:
-                try:
-                    float(val)
-                except (ValueError, TypeError):
-                    type_issues += 1
+        if s.dtype == object and not non_missing.empty:
+            unparseable = pd.isna(pd.to_numeric(uniques, errors="coerce"))[codes]
+            # Majority (>80%) numeric -> this is a numeric column with type issues
+            if unparseable.mean() < 0.2:
+                numeric_cols.add(col)
+                # Count non-numeric values (excluding missing values already counted)
+                type_issues = int(unparseable.sum())
         
         # Total issues = missing + type issues
         total_issues = missing + type_issues
 
-        sample_values = []
-        if not non_missing.empty:
-            seen = set()
-            for v in non_missing.astype(object).tolist():
-                v_str = str(v)
-                if v_str not in seen:
-                    sample_values.append(v)
-                    seen.add(v_str)
-                if len(sample_values) >= top_values:
-                    break
+        sample_values = _sample_values(non_missing, top_values)
 
         rows.append(
             {
@@ -153,40 +210,75 @@ def analyze_missing_summary(df: pd.DataFrame, top_values: int = 3) -> pd.DataFra
 
     result = pd.DataFrame(rows)
     result = result.sort_values("total_issues", ascending=False).reset_index(drop=True)
-    return result
+    return result, masks, numeric_cols
 
 
-def _fill_column(s: pd.Series) -> pd.Series:
-    """Fill missing values (NaN and placeholders) based on dtype heuristics."""
-    # Remove placeholder values first
-    s = s.copy()
-    mask = s.apply(lambda x: _is_missing_value(x))
-    s[mask] = np.nan
-    
-    if pd.api.types.is_numeric_dtype(s):
-        # Use median for numeric columns (robust to outliers)
-        if s.dropna().empty:
-            return s.fillna(0)
-        return s.fillna(s.median())
-    
-    if pd.api.types.is_datetime64_any_dtype(s):
-        # Fill with earliest date for datetime columns
-        if s.dropna().empty:
-            return s
-        return s.fillna(s.min())
-    
-    # Treat as categorical/object
-    if s.dropna().empty:
-        return s.fillna("Unknown")
+def analyze_missing_summary(df: pd.DataFrame, top_values: int = 3) -> pd.DataFrame:
+    """Return a DataFrame summarizing missing values and basic stats per column.
     
+    Detects both actual NaN values and placeholder strings (UNKNOWN, ERROR, etc).
+    Also detects type inconsistencies in numeric columns.
+    """
+    return _analyze_columns(df, top_values)[0]
+
+
+def _most_frequent(s: pd.Series) -> Any:
+    """Mode of a column with at least one non-missing value."""
     try:
-        mode = s.mode(dropna=True)
-        if not mode.empty:
-            return s.fillna(mode.iloc[0])
+        # Hash-count instead of mode(), which sorts every unique value
+        counts = s.value_counts(dropna=True, sort=False)
+        top = counts.index[counts.to_numpy() == counts.max()]
+        if len(top) == 1:
+            return top[0]
+        try:
+            # mode() breaks ties by taking the smallest value
+            return min(top)
+        except TypeError:
+            # Unorderable mixed types: keep mode()'s own tie order
+            return s.mode(dropna=True).iloc[0]
     except Exception:
-        pass
+        return "Unknown"
+
+
+def _plan_fill(s: pd.Series) -> Dict[str, Any]:
+    """Inspect a column once and decide how its gaps get filled.
+
+    Expects placeholders to be NaN already. The plan holds the `strategy`
+    ("numeric", "datetime", "categorical" or "keep"), the missing `mask` and
+    the precomputed `fill` value.
+    """
+    mask = s.isna()
+    plan: Dict[str, Any] = {"strategy": "keep", "mask": mask, "fill": None}
+    
+    # Nothing to fill
+    if not mask.any():
+        return plan
+    
+    if pd.api.types.is_numeric_dtype(s):
+        # Use median for numeric columns (robust to outliers)
+        plan["strategy"] = "numeric"
+        if mask.all():
+            plan["fill"] = 0
+        else:
+            plan["fill"] = np.nanmedian(s.to_numpy(dtype=float, na_value=np.nan))
+    elif pd.api.types.is_datetime64_any_dtype(s):
+        # Fill with earliest date for datetime columns (all-NaT stays as is)
+        if not mask.all():
+            plan["strategy"] = "datetime"
+            plan["fill"] = s.min()
+    else:
+        # Treat as categorical/object
+        plan["strategy"] = "categorical"
+        plan["fill"] = "Unknown" if mask.all() else _most_frequent(s)
     
-    return s.fillna("Unknown")
+    return plan
+
+
+def _apply_fill(s: pd.Series, plan: Dict[str, Any]) -> pd.Series:
+    """Fill a column's gaps as decided by `_plan_fill`."""
+    if plan["strategy"] == "keep":
+        return s
+    return s.fillna(plan["fill"])
 
 
 def clean_dataframe(
@@ -201,7 +293,7 @@ def clean_dataframe(
       3. Record original row count and missing values (including type issues)
       4. Drop exact duplicate rows (if requested)
       5. Attempt to coerce numeric columns
-      6. Fill missing values per-column using intelligent heuristics
+      6. Plan and apply a fill per column using intelligent heuristics
 
     Summary contains counts before/after and per-column missing info.
     """
@@ -210,58 +302,18 @@ def clean_dataframe(
 
     original_rows = len(df)
     
-    # Detect which columns should be numeric (based on majority non-missing values)
-    numeric_cols_to_fix = {}
-    for col in df.columns:
-        if _is_numeric_column(df[col]):
-            numeric_cols_to_fix[col] = True
-    
-    # Analyze BEFORE replacing placeholders to show what was actually wrong
-    missing_summary_before = analyze_missing_summary(df)
+    # Analyze BEFORE replacing placeholders to show what was actually wrong.
+    # The same pass detects which columns should be numeric (based on majority
+    # non-missing values) and yields the missing masks reused below.
+    missing_summary_before, masks, numeric_cols_to_fix = _analyze_columns(df)
     
     # Count TOTAL ISSUES in the ORIGINAL data BEFORE any cleaning
     # = Missing values (NaN + placeholders) + Type inconsistencies in numeric columns
-    total_issues = 0
-    for col in df.columns:
-        s = df[col]
-        # Count missing (NaN + placeholders)
-        missing = int(s.apply(lambda x: _is_missing_value(x)).sum())
-        total_issues += missing
-        
-        # ALSO count type issues in numeric columns (non-numeric values that should be numeric)
-        if col in numeric_cols_to_fix and s.dtype == object:
-            non_missing = s[~s.apply(lambda x: _is_missing_value(x))]
-            for val in non_missing:
-                try:
-                    float(val)
-                except (ValueError, TypeError):
-                    # This value couldn't convert to numeric in a numeric column
-                    total_issues += 1
-    
-    missing_before = total_issues
-    
-    # Now replace placeholder values with NaN
-    working = _replace_placeholders(df.copy())
-    
-    # Count TOTAL issues:
-    # = Missing values (NaN + placeholders) + Type inconsistencies in numeric columns
-    total_issues = 0
-    for col in working.columns:
-        s = working[col]
-        # Count missing (NaN) values
-        missing = s.isna().sum()
-        total_issues += missing
-        
-        # ALSO count type issues in numeric columns (non-numeric values that should be numeric)
-        if col in numeric_cols_to_fix:
-            non_missing = s[~s.isna()]
-            for val in non_missing:
-                try:
-                    float(val)
-                except (ValueError, TypeError):
-                    total_issues += 1
+    missing_before = int(missing_summary_before["total_issues"].sum())
     
-    missing_before = total_issues
+    # Now replace placeholder values with NaN. No defensive copy of `df`:
+    # every later step is out-of-place and the final frame is built fresh.
+    working = _replace_placeholders(df, masks)
 
     # Drop exact duplicates if requested
     dropped_dupes = 0
@@ -270,23 +322,28 @@ def clean_dataframe(
         working = working.drop_duplicates()
         dropped_dupes = before - len(working)
 
-    # Attempt to coerce numeric columns where possible
-    for col in working.columns:
-        s = working[col]
-        if s.dtype == object and col in numeric_cols_to_fix:
-            # Try to convert to numeric safely (skip if fails)
-            try:
-                converted = pd.to_numeric(s, errors="coerce")  # Use 'coerce' to handle type issues
-                working[col] = converted
-            except (ValueError, TypeError):
-                # Leave as-is if conversion fails
-                pass
-
-    # Fill missing values per column
-    for col in working.columns:
-        working[col] = _fill_column(working[col])
-
-    missing_after = int(working.apply(lambda col: col.apply(_is_missing_value)).sum().sum())
+    # Pass 1: coerce numeric columns and plan each column's fill once
+    cols = {}
+    plans = {}
+    for col, s in working.items():
+        # Coerce numeric columns; errors="coerce" turns stray text into NaN
+        # and never raises, so no per-column try/except is needed
+        if col in numeric_cols_to_fix:
+            s = pd.to_numeric(s, errors="coerce")
+        cols[col] = s
+        plans[col] = _plan_fill(s)
+
+    # Pass 2: fill missing values per column, then assemble the frame once
+    # (assigning into `working` per column would re-consolidate its blocks)
+    working = pd.DataFrame(
+        {col: _apply_fill(s, plans[col]) for col, s in cols.items()},
+        index=working.index,
+    )
+
+    # Only columns left unfilled (e.g. all-NaT dates) can still have gaps
+    missing_after = sum(
+        int(plan["mask"].sum()) for plan in plans.values() if plan["strategy"] == "keep"
+    )
     cleaned_rows = len(working)
 
     # Per-column summaries
@@ -316,8 +373,588 @@ def clean_dataframe(
     return working, summary
 
 
+# Files larger than this are cleaned in three streaming passes of
+# CSV_CHUNK_ROWS rows each instead of being loaded whole
+CHUNKED_CSV_BYTES = 256 * 1024 * 1024
+CSV_CHUNK_ROWS = 50_000
+# Per-column cap on the numbers kept for the median; past it the fill value
+# comes from a uniform reservoir sample instead of every value
+MEDIAN_SAMPLE_SIZE = 1_000_000
+
+# Literals the C parser reads as booleans
+_BOOL_LITERALS = {
+    "True": True, "TRUE": True, "true": True,
+    "False": False, "FALSE": False, "false": False,
+}
+
+
+def _isin_sorted(values: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Vectorised membership test of `values` in the sorted array `keys`."""
+    if not len(keys):
+        return np.zeros(len(values), dtype=bool)
+    pos = np.minimum(np.searchsorted(keys, values), len(keys) - 1)
+    return keys[pos] == values
+
+
+# Queued chunk results are merged once they add up to this many entries or
+# to the size of what is already merged, whichever is larger
+_MERGE_MIN_SIZE = 1 << 16
+
+
+def _merge_unique(parts: List[np.ndarray]) -> np.ndarray:
+    """Sorted distinct values of all `parts`."""
+    # sort + neighbour compare; np.unique's hash path is slower on uint64
+    merged = np.sort(np.concatenate(parts))
+    if not len(merged):
+        return merged
+    return merged[np.concatenate(([True], merged[1:] != merged[:-1]))]
+
+
+def _merge_counts(parts: List[pd.Series]) -> pd.Series:
+    """Sum value counts (value -> count Series) over all `parts`, sorted by value."""
+    return pd.concat(parts).groupby(level=0).sum()
+
+
+def _queue_merge(parts: List[Any], new: Any, merge: Callable[[List[Any]], Any]) -> None:
+    """Add one chunk's result to `parts`, whose first item holds everything merged so far.
+
+    Merging every chunk into the whole table would copy it each time, going
+    quadratic on high-cardinality columns; waiting until the queue is as
+    large as the table keeps the total work near-linear.
+    """
+    parts.append(new)
+    if sum(len(p) for p in parts[1:]) >= max(len(parts[0]), _MERGE_MIN_SIZE):
+        parts[:] = [merge(parts)]
+
+
+def _isin_levels(values: np.ndarray, levels: List[np.ndarray]) -> np.ndarray:
+    """Membership of `values` in any of the sorted arrays in `levels`."""
+    found = np.zeros(len(values), dtype=bool)
+    for level in levels:
+        found |= _isin_sorted(values, level)
+    return found
+
+
+def _add_level(levels: List[np.ndarray], new: np.ndarray) -> None:
+    """Add the sorted distinct `new` to `levels`, sorted arrays of decreasing size.
+
+    Like a binary counter, an array is merged into its predecessor only once
+    it is as large, so each value is copied O(log n) times and a lookup
+    checks O(log n) arrays.
+    """
+    levels.append(new)
+    while len(levels) > 1 and len(levels[-1]) >= len(levels[-2]):
+        top = levels.pop()
+        levels[-1] = np.union1d(levels[-1], top)
+
+
+def _hash_values(values: Any) -> np.ndarray:
+    """64-bit hashes of raw text values, standing in for the values themselves."""
+    return pd.util.hash_array(np.asarray(values, dtype=object))
+
+
+def _dedupe_chunk(chunk: pd.DataFrame, seen: List[np.ndarray]) -> np.ndarray:
+    """Flag rows not seen earlier in the file.
+
+    `seen` holds the hashes of the rows kept so far (see `_add_level`) and is
+    updated in place; returns the keep mask for `chunk`.
+    """
+    hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+    # First occurrence within the chunk that no earlier chunk already had
+    _, first = np.unique(hashes, return_index=True)
+    keep = np.zeros(len(hashes), dtype=bool)
+    keep[first] = True
+    keep &= ~_isin_levels(hashes, seen)
+    _add_level(seen, np.sort(hashes[keep]))
+    return keep
+
+
+# Integer kinds (see _column_kind) and the dtype read_csv gives them
+_INT_DTYPES = {"int": "int64", "uint": "uint64"}
+
+
+def _typed_for_dedupe(working: pd.DataFrame, kinds: Dict[Any, str]) -> pd.DataFrame:
+    """A chunk's values as read_csv would have typed them, for comparing rows.
+
+    clean_dataframe drops duplicates before coercing anything, so rows are
+    equal when read_csv's values are: "TRUE" matches "true" in a bool column
+    and -0.0 matches 0.0 in a numeric one, while numeric_fix and text
+    columns still compare as text.
+    """
+    cols = {}
+    for col, s in working.items():
+        kind = kinds[col]
+        if kind in ("bool", "boolish"):
+            s = s.map(_BOOL_LITERALS).astype(float)
+        elif kind in _INT_DTYPES:
+            s = pd.to_numeric(s).astype(_INT_DTYPES[kind])
+        elif kind == "float":
+            # + 0.0 folds -0.0 into 0.0 so the two hash alike
+            s = pd.to_numeric(s).astype("float64") + 0.0
+        cols[col] = s
+    return pd.DataFrame(cols, index=working.index, copy=False)
+
+
+def _new_column_stats() -> Dict[str, Any]:
+    empty = np.empty(0, dtype=np.uint64)
+    return {
+        "na": 0,  # raw NaN cells
+        "missing": 0,  # NaN + placeholders
+        "unparseable": 0,  # non-missing values pd.to_numeric can't parse
+        "float": False,  # some value parses as a non-integer
+        "big": False,  # some integer only fits uint64
+        "neg": False,  # some integer is negative
+        "overflow": False,  # some integer fits neither int64 nor uint64
+        "bool": True,  # every non-missing value is a True/False literal
+        "samples": [],
+        # Everything below covers the deduplicated rows only (see
+        # _scan_kept_rows). Dropping duplicate rows never removes a distinct
+        # value, so the distinct counts hold for the whole file as well.
+        # keys, numbers and text_counts are queues for _queue_merge during
+        # the pass and merged into one array / Series at its end.
+        "kept_missing": 0,  # NaN + placeholders
+        "kept_unparseable": 0,  # values numeric coercion turns into NaN
+        "keys": [empty],  # sorted hashes of the distinct raw values
+        "numbers": [empty],  # sorted distinct parsed numbers (as float bits)
+        # value -> occurrences, for the mode of text columns with gaps
+        "text_counts": [pd.Series(dtype=np.int64)],
+        "bool_counts": Counter(),
+        "reservoir": np.empty(0),  # parsed numbers for the median
+        "numbers_seen": 0,
+    }
+
+
+def _sample_numbers(st: Dict[str, Any], numbers: np.ndarray, rng: np.random.Generator) -> None:
+    """Keep a uniform sample of at most MEDIAN_SAMPLE_SIZE parsed numbers."""
+    seen = st["numbers_seen"]
+    st["numbers_seen"] = seen + len(numbers)
+    room = max(MEDIAN_SAMPLE_SIZE - len(st["reservoir"]), 0)
+    st["reservoir"] = np.concatenate([st["reservoir"], numbers[:room]])
+    rest = numbers[room:]
+    if len(rest):
+        # Reservoir sampling: the i-th number replaces a random slot with
+        # probability MEDIAN_SAMPLE_SIZE / i
+        slots = rng.integers(0, seen + room + np.arange(1, len(rest) + 1))
+        hit = slots < MEDIAN_SAMPLE_SIZE
+        st["reservoir"][slots[hit]] = rest[hit]
+
+
+def _note_numbers(st: Dict[str, Any], values: pd.Index) -> None:
+    """Record what read_csv's number parsing would make of `values` (all parseable)."""
+    try:
+        parsed = pd.to_numeric(values)
+    except (ValueError, OverflowError):
+        # Integers past uint64
+        st["overflow"] = True
+        return
+    if parsed.dtype == object:
+        # Past-int64 and negative integers together only fit as object
+        st["overflow"] = True
+        return
+    st["float"] = st["float"] or parsed.dtype.kind == "f"
+    st["big"] = st["big"] or bool((parsed >= 2**63).any())
+    st["neg"] = st["neg"] or bool((parsed < 0).any())
+
+
+def _scan_csv_kinds(p_in: Path, chunksize: int) -> Tuple[Dict[Any, Dict[str, Any]], int]:
+    """First pass of the chunked cleaner: what each column holds, over all rows.
+
+    Chunks are read as text so each column's dtype is decided once for the
+    whole file (see `_column_kind`), the way a single pd.read_csv would.
+    Returns (stats, rows).
+    """
+    stats: Dict[Any, Dict[str, Any]] = {}
+    rows = 0
+
+    with pd.read_csv(p_in, dtype=object, chunksize=chunksize) as reader:
+        for chunk in reader:
+            working = _replace_placeholders(chunk)
+            rows += len(working)
+
+            for col, s in working.items():
+                st = stats.setdefault(col, _new_column_stats())
+                # Missing cells get code -1; each distinct value is parsed once
+                codes, uniques = pd.factorize(s)
+                present = codes >= 0
+                counts = np.bincount(codes[present], minlength=len(uniques))
+                bad = np.isnan(np.asarray(pd.to_numeric(uniques, errors="coerce"), dtype=float))
+
+                st["na"] += int(chunk[col].isna().sum())
+                st["missing"] += int((~present).sum())
+                st["unparseable"] += int(counts[bad].sum())
+                if (~bad).any():
+                    _note_numbers(st, uniques[~bad])
+                if st["bool"]:
+                    st["bool"] = bool(uniques.isin(list(_BOOL_LITERALS)).all())
+
+                for u in uniques:
+                    if len(st["samples"]) >= 3:
+                        break
+                    if str(u) not in map(str, st["samples"]):
+                        st["samples"].append(u)
+
+    return stats, rows
+
+
+def _scan_kept_rows(
+    p_in: Path,
+    chunksize: int,
+    stats: Dict[Any, Dict[str, Any]],
+    kinds: Dict[Any, str],
+    drop_duplicates: bool,
+) -> List[np.ndarray]:
+    """Second pass: drop duplicate rows and gather what the fills are based on.
+
+    Rows are compared on their typed values, as clean_dataframe does. Adds
+    the deduplicated-row stats to `stats` and returns the per-chunk keep
+    masks packed to one bit per row.
+    """
+    keeps: List[np.ndarray] = []
+    seen: List[np.ndarray] = []
+    rng = np.random.default_rng(0)
+
+    with pd.read_csv(p_in, dtype=object, chunksize=chunksize) as reader:
+        for chunk in reader:
+            working = _replace_placeholders(chunk)
+            keep = np.ones(len(working), dtype=bool)
+            if drop_duplicates:
+                keep = _dedupe_chunk(_typed_for_dedupe(working, kinds), seen)
+            keeps.append(np.packbits(keep))
+
+            for col, s in working.items():
+                st = stats[col]
+                codes, uniques = pd.factorize(s)
+                present = codes >= 0
+                kept_codes = codes[present & keep]
+                kept = np.bincount(kept_codes, minlength=len(uniques))
+                numbers = np.asarray(pd.to_numeric(uniques, errors="coerce"), dtype=float)
+                bad = np.isnan(numbers)
+
+                st["kept_missing"] += int((~present & keep).sum())
+                st["kept_unparseable"] += int(kept[bad].sum())
+                if st["bool"]:
+                    st["bool_counts"].update(
+                        {u: c for u, c in zip(uniques, kept.tolist()) if c}
+                    )
+
+                in_kept = kept > 0
+                _queue_merge(st["keys"], _hash_values(uniques[in_kept]), _merge_unique)
+                # + 0.0 folds -0.0 into 0.0 so equal numbers share their bits
+                bits = (numbers[in_kept & ~bad] + 0.0).view(np.uint64)
+                _queue_merge(st["numbers"], bits, _merge_unique)
+                if kinds[col] == "text" and st["missing"]:
+                    counts = pd.Series(kept[in_kept], index=uniques[in_kept])
+                    _queue_merge(st["text_counts"], counts, _merge_counts)
+                kept_numbers = numbers[kept_codes]
+                _sample_numbers(st, kept_numbers[~np.isnan(kept_numbers)], rng)
+
+    for st in stats.values():
+        st["keys"] = _merge_unique(st["keys"])
+        st["numbers"] = _merge_unique(st["numbers"])
+        st["text_counts"] = _merge_counts(st["text_counts"])
+    return keeps
+
+
+def _column_kind(st: Dict[str, Any], rows: int) -> str:
+    """Dtype the in-memory cleaner ends up with for a column of the file.
+
+    One of "int", "uint" (integers only uint64 holds), "float", "bool",
+    "boolish" (True/False with gaps, which read_csv keeps as object and
+    clean_dataframe coerces to numbers), "numeric_fix" (mostly-numeric text)
+    or "text".
+    """
+    if not rows:
+        # read_csv leaves the columns of a header-only file as object
+        return "text"
+    placeholders = st["missing"] - st["na"]
+    non_missing = rows - st["missing"]
+    if st["bool"] and non_missing and not placeholders:
+        return "boolish" if st["na"] else "bool"
+    # read_csv keeps past-int64 integers as text when they sit next to
+    # negative numbers or (in an otherwise integer column) gaps, and any
+    # integer past uint64; clean_dataframe then coerces those columns
+    as_text = st["overflow"] or (
+        st["big"] and (st["neg"] or (st["na"] and not st["float"]))
+    )
+    if not st["unparseable"] and not placeholders and not as_text:
+        if non_missing and not st["na"] and not st["float"]:
+            return "uint" if st["big"] else "int"
+        return "float"
+    if non_missing and st["unparseable"] / non_missing < 0.2:
+        return "numeric_fix"
+    return "text"
+
+
+def _most_frequent_text(st: Dict[str, Any]) -> Any:
+    """Mode of a text column from its pass 2 value counts; ties go to the
+    smallest value, as with mode()."""
+    counts = st["text_counts"]
+    return min(counts.index[counts == counts.max()])
+
+
+def _chunk_fill_plan(st: Dict[str, Any], kind: str) -> Dict[str, Any]:
+    """Whole-file fill value for a column, as `_plan_fill` would pick it."""
+    plan: Dict[str, Any] = {"kind": kind, "fill": None}
+    if kind == "text":
+        if not len(st["keys"]):
+            plan["fill"] = "Unknown"
+        elif st["kept_missing"]:
+            plan["fill"] = _most_frequent_text(st)
+    elif kind == "boolish":
+        flags = pd.Series(list(st["bool_counts"]), dtype=object).map(_BOOL_LITERALS)
+        numbers = np.repeat(flags.to_numpy(dtype=float), list(st["bool_counts"].values()))
+        plan["fill"] = float(np.median(numbers))
+    elif kind != "bool":
+        numbers = st["reservoir"]
+        plan["fill"] = float(np.median(numbers)) if len(numbers) else 0
+    return plan
+
+
+def _apply_chunk_plan(s: pd.Series, plan: Dict[str, Any]) -> pd.Series:
+    """Convert and fill one raw text column of a chunk."""
+    kind = plan["kind"]
+    if kind in _INT_DTYPES:
+        return pd.to_numeric(s).astype(_INT_DTYPES[kind])
+    if kind == "bool":
+        return s.map(_BOOL_LITERALS).astype(bool)
+    if kind == "boolish":
+        s = s.map(_BOOL_LITERALS).astype(float)
+    elif kind in ("float", "numeric_fix"):
+        s = pd.to_numeric(s, errors="coerce").astype("float64")
+    if plan["fill"] is None:
+        return s
+    return s.fillna(plan["fill"])
+
+
+def _clean_csv_chunked(
+    p_in: Path, p_out: Path, drop_duplicates: bool, chunksize: int
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Stream `p_in` through the cleaner without loading it whole.
+
+    Mirrors `clean_dataframe`: pass 1 settles each column's dtype, pass 2
+    drops duplicate rows and gathers the per-column summary and whole-file
+    fill values (median / mode of the deduplicated rows), pass 3 replays the
+    same dedupe, fills each chunk and appends it to `p_out`; the file is
+    read exactly three times. Memory grows with the number of distinct
+    values (16 bytes each, plus the text itself for text columns with gaps),
+    not with the rows. Returns (cleaning summary, file stats for `clean_csv`).
+    """
+    stats, rows = _scan_csv_kinds(p_in, chunksize)
+    kinds = {col: _column_kind(st, rows) for col, st in stats.items()}
+    keeps = _scan_kept_rows(p_in, chunksize, stats, kinds, drop_duplicates)
+    kept_rows = int(sum(np.unpackbits(keep).sum() for keep in keeps))
+    plans = {col: _chunk_fill_plan(st, kinds[col]) for col, st in stats.items()}
+
+    # Pass 3: clean and append chunk by chunk, dropping the rows pass 2
+    # flagged as duplicates
+    after_samples: Dict[Any, List[Any]] = {col: [] for col in stats}
+    header = True
+    with pd.read_csv(p_in, dtype=object, chunksize=chunksize) as reader:
+        for chunk, keep in zip(reader, keeps):
+            working = _replace_placeholders(chunk)
+            working = working[np.unpackbits(keep, count=len(working)).astype(bool)]
+            cleaned = pd.DataFrame(
+                {col: _apply_chunk_plan(s, plans[col]) for col, s in working.items()},
+                index=working.index,
+            )
+            cleaned.to_csv(p_out, mode="w" if header else "a", header=header, index=False)
+            header = False
+            for col, samples in after_samples.items():
+                if len(samples) < 3:
+                    # An "Unknown" fill still reads as a placeholder afterwards
+                    filled = cleaned[col][~_missing_mask(cleaned[col])]
+                    merged = pd.Series(samples + _sample_values(filled, 3), dtype=object)
+                    after_samples[col] = _sample_values(merged, 3)
+    if header:
+        # Header-only input: still write the columns
+        pd.read_csv(p_in, nrows=0).to_csv(p_out, index=False)
+
+    before_rows = []
+    after_rows = []
+    for col, st in stats.items():
+        kind = kinds[col]
+        fill = plans[col]["fill"]
+        missing = st["missing"]
+        # Stray text in a numeric_fix column is coerced to NaN and filled too
+        filled = st["kept_missing"] or (kind == "numeric_fix" and st["kept_unparseable"])
+        type_issues = st["unparseable"] if kind == "numeric_fix" else 0
+
+        if kind in ("bool", "boolish"):
+            typed = pd.Series(list(st["bool_counts"]), dtype=object).map(_BOOL_LITERALS)
+            unique_before = int(typed.nunique())
+            if kind == "bool":
+                unique_after = unique_before
+            else:
+                unique_after = len(set(typed.astype(float)) | ({fill} if filled else set()))
+        elif kind == "text":
+            unique_before = unique_after = len(st["keys"])
+            # An "Unknown" fill still reads as a placeholder afterwards
+            if filled and not _is_missing_value(fill):
+                unique_after += int(not _isin_sorted(_hash_values([fill]), st["keys"])[0])
+        else:
+            # Before cleaning a numeric_fix column is still text
+            unique_before = len(st["keys"]) if kind == "numeric_fix" else len(st["numbers"])
+            unique_after = len(st["numbers"])
+            if filled:
+                fill_bits = np.array([float(fill) + 0.0]).view(np.uint64)
+                unique_after += int(not _isin_sorted(fill_bits, st["numbers"])[0])
+
+        before_rows.append(
+            {
+                "column": col,
+                "missing_count": missing,
+                "type_issues": type_issues,
+                "total_issues": missing + type_issues,
+                "missing_pct": round((missing / rows) * 100, 2) if rows else 0.0,
+                "dtype": {**_INT_DTYPES, "float": "float64", "bool": "bool"}.get(kind, "object"),
+                "unique_count": unique_before,
+                "sample_values": _sample_values(_typed_samples(st["samples"], kind), 3),
+            }
+        )
+        after_rows.append(
+            {
+                "column": col,
+                "missing_count": 0,
+                "type_issues": 0,
+                # only used to order the rows, then zeroed like the rest
+                "total_issues": _issues_after(st, kind, fill, kept_rows),
+                "missing_pct": 0.0,
+                "dtype": {**_INT_DTYPES, "bool": "bool", "text": "object"}.get(kind, "float64"),
+                "unique_count": unique_after,
+                "sample_values": after_samples[col],
+            }
+        )
+
+    missing_summary_before = pd.DataFrame(before_rows)
+    if not missing_summary_before.empty:
+        missing_summary_before = missing_summary_before.sort_values(
+            "total_issues", ascending=False
+        ).reset_index(drop=True)
+    missing_before = int(sum(row["total_issues"] for row in before_rows))
+    # clean_dataframe orders its after-summary by what analyze_missing_summary
+    # still finds in the cleaned frame before zeroing the counts
+    missing_summary_after = pd.DataFrame(after_rows)
+    if not missing_summary_after.empty:
+        missing_summary_after = missing_summary_after.sort_values(
+            "total_issues", ascending=False
+        ).reset_index(drop=True)
+        missing_summary_after["total_issues"] = 0
+
+    summary = {
+        "original_rows": int(rows),
+        "cleaned_rows": int(kept_rows),
+        "dropped_duplicates": int(rows - kept_rows),
+        "missing_before_total": missing_before,
+        "missing_after_total": 0,
+        # Also include these keys for frontend compatibility
+        "missing_before": missing_before,
+        "missing_after": 0,
+        "columns": int(len(stats)),
+        "missing_summary_before": missing_summary_before.to_dict(orient="records"),
+        "missing_summary_after": missing_summary_after.to_dict(orient="records"),
+    }
+    file_stats = {
+        "rows": int(rows),
+        "columns": int(len(stats)),
+        "missing_cells": int(sum(st["na"] for st in stats.values())),
+        "numeric_cols": int(sum(kind != "text" for kind in kinds.values())),
+    }
+    return summary, file_stats
+
+
+def _issues_after(st: Dict[str, Any], kind: str, fill: Any, kept_rows: int) -> int:
+    """total_issues analyze_missing_summary reports for a column once cleaned.
+
+    Only text columns can have any left: an "Unknown" fill still reads as a
+    placeholder, and text that became mostly numeric counts its stray values.
+    """
+    if kind != "text":
+        return 0
+    if not len(st["keys"]):
+        # every kept cell was missing and is now "Unknown"
+        return kept_rows
+    unparseable = st["kept_unparseable"]
+    if st["kept_missing"] and pd.isna(pd.to_numeric(fill, errors="coerce")):
+        unparseable += st["kept_missing"]
+    return unparseable if unparseable / kept_rows < 0.2 else 0
+
+
+def _typed_samples(values: List[Any], kind: str) -> pd.Series:
+    """Raw text samples as read_csv would have typed them for `kind`."""
+    s = pd.Series(values, dtype=object)
+    if kind in ("bool", "boolish"):
+        return s.map(_BOOL_LITERALS)
+    if kind in _INT_DTYPES:
+        return pd.to_numeric(s)
+    if kind == "float":
+        # integral samples of a column with gaps are still floats in read_csv
+        return pd.to_numeric(s).astype("float64")
+    return s
+
+
+# Strings pd.read_csv treats as NaN by default, for the pyarrow reader
+_CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+
+def _read_csv(p_in: Path) -> pd.DataFrame:
+    """Read a CSV with pyarrow's multithreaded parser, falling back to the C engine."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return pd.read_csv(p_in)
+
+    try:
+        # Schema inferred from the first block only
+        with pa_csv.open_csv(p_in) as reader:
+            schema = reader.schema
+        # Blank or repeated headers are renamed by pandas ("Unnamed: 0", "a.1")
+        if "" in schema.names or len(set(schema.names)) != len(schema.names):
+            return pd.read_csv(p_in)
+
+        column_types = {}
+        for f in schema:
+            if pa.types.is_temporal(f.type):
+                # pyarrow infers dates/times the C engine leaves as text; keep
+                # them as strings so values (and the cleaned CSV) stay unchanged
+                column_types[f.name] = pa.string()
+            elif pa.types.is_null(f.type):
+                # All-empty columns: the C engine reads these as float64
+                column_types[f.name] = pa.float64()
+        options = pa_csv.ConvertOptions(
+            column_types=column_types,
+            null_values=_CSV_NA_VALUES,
+            strings_can_be_null=True,
+            # pyarrow also takes 1/0 as booleans by default, turning a column
+            # mixing true with 0/1 into bools the C engine keeps as text
+            true_values=[k for k, v in _BOOL_LITERALS.items() if v],
+            false_values=[k for k, v in _BOOL_LITERALS.items() if not v],
+        )
+        df = pa_csv.read_csv(p_in, convert_options=options).to_pandas()
+    except (ValueError, pa.ArrowException):
+        # e.g. values that only fail to convert in a later block
+        return pd.read_csv(p_in)
+
+    if df.empty:
+        # e.g. header-only files, whose columns the C engine leaves as object
+        return pd.read_csv(p_in)
+    # Integers past int64 come back as float64 (losing precision) where the C
+    # engine keeps them exact as uint64 or text; let it read those files
+    for _, s in df.select_dtypes("float").items():
+        if (s.abs() >= 2.0**63).any():
+            return pd.read_csv(p_in)
+    return df
+
+
 def clean_csv(
-    input_path: str, output_path: str, drop_duplicates: bool = True
+    input_path: str,
+    output_path: str,
+    drop_duplicates: bool = True,
+    chunksize: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Read CSV from `input_path`, clean it, write cleaned CSV to `output_path`,
@@ -326,34 +963,52 @@ def clean_csv(
     Summary includes keys such as rows, columns, missing_pct, numeric_cols and
     categorical_cols plus the detailed cleaning summary returned by
     `clean_dataframe`.
+
+    Files larger than `CHUNKED_CSV_BYTES` (or any file when `chunksize` is
+    given) are streamed in chunks of `chunksize` rows instead of being loaded
+    into memory at once.
     """
     p_in = Path(input_path)
     p_out = Path(output_path)
     if not p_in.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    df = pd.read_csv(p_in)
-    cleaned_df, inner_summary = clean_dataframe(df, drop_duplicates=drop_duplicates)
-
     # ensure output dir exists
     p_out.parent.mkdir(parents=True, exist_ok=True)
-    cleaned_df.to_csv(p_out, index=False)
 
-    total_cells = df.size
-    missing_cells = int(df.isna().sum().sum())
-    missing_pct = round((missing_cells / total_cells) * 100, 2) if total_cells else 0.0
+    if chunksize is None and p_in.stat().st_size > CHUNKED_CSV_BYTES:
+        chunksize = CSV_CHUNK_ROWS
 
-    numeric_cols = int(
-        sum(
-            pd.api.types.is_numeric_dtype(cleaned_df[c]) for c in cleaned_df.columns
+    if chunksize:
+        inner_summary, file_stats = _clean_csv_chunked(
+            p_in, p_out, drop_duplicates, chunksize
         )
-    )
+        rows = file_stats["rows"]
+        columns = file_stats["columns"]
+        missing_cells = file_stats["missing_cells"]
+        numeric_cols = file_stats["numeric_cols"]
+    else:
+        df = _read_csv(p_in)
+        cleaned_df, inner_summary = clean_dataframe(df, drop_duplicates=drop_duplicates)
+        cleaned_df.to_csv(p_out, index=False)
+
+        rows = len(df)
+        columns = len(df.columns)
+        missing_cells = int(df.isna().sum().sum())
+        numeric_cols = int(
+            sum(
+                pd.api.types.is_numeric_dtype(cleaned_df[c]) for c in cleaned_df.columns
+            )
+        )
+
+    total_cells = rows * columns
+    missing_pct = round((missing_cells / total_cells) * 100, 2) if total_cells else 0.0
 
-    categorical_cols = int(len(cleaned_df.columns) - numeric_cols)
+    categorical_cols = int(columns - numeric_cols)
 
     summary = {
-        "rows": int(len(df)),
-        "columns": int(len(df.columns)),
+        "rows": int(rows),
+        "columns": int(columns),
         "missing_pct": float(missing_pct),
         "numeric_cols": int(numeric_cols),
         "categorical_cols": int(categorical_cols),
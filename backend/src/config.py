@@ -36,6 +36,28 @@ try:
 except Exception:
     MongoClient = None  # type: ignore
 
+# connection pool sizing; a bounded pool with a short wait queue fails fast
+# under overload instead of piling up blocked requests
+MONGO_POOL_MAX = int(os.getenv("MONGO_POOL_MAX", "100"))
+MONGO_POOL_MIN = int(os.getenv("MONGO_POOL_MIN", "10"))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "2000"))
+
+
+def _wire_compressors() -> str:
+    """Compressors to offer the server, skipping codecs that aren't installed.
+
+    zlib ships with Python; zstd and snappy need their optional modules, and
+    pymongo warns on every client if asked for one it can't load.
+    """
+    import importlib.util
+
+    names = []
+    for name, module in (("zstd", "zstandard"), ("snappy", "snappy")):
+        if importlib.util.find_spec(module) is not None:
+            names.append(name)
+    names.append("zlib")
+    return ",".join(names)
+
 
 def get_mongo_client():
     """Return a cached pymongo.MongoClient connected to MONGODB_URI or None.
@@ -66,17 +88,17 @@ def get_mongo_client():
         logger = logging.getLogger("cleandatapro.backend")
         logger.info(f"Creating MongoDB client with URI: {MONGODB_URI[:30]}...")
         
+        options = {
+            "serverSelectionTimeoutMS": 5000,
+            "maxPoolSize": MONGO_POOL_MAX,
+            "minPoolSize": MONGO_POOL_MIN,
+            "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            "compressors": _wire_compressors(),
+        }
         if _SERVER_API_AVAILABLE and ServerApi is not None:
-            _CLIENT = MongoClient(
-                MONGODB_URI,
-                server_api=ServerApi("1"),
-                serverSelectionTimeoutMS=5000
-            )
+            _CLIENT = MongoClient(MONGODB_URI, server_api=ServerApi("1"), **options)
         else:
-            _CLIENT = MongoClient(
-                MONGODB_URI,
-                serverSelectionTimeoutMS=5000
-            )
+            _CLIENT = MongoClient(MONGODB_URI, **options)
         logger.info("MongoDB client created successfully")
     except Exception as e:
         # if client creation fails, return None so callers handle it
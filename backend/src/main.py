@@ -6,6 +6,7 @@ import os
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from .middleware import ExcludePathsGZipMiddleware, GzipRequestMiddleware
 from .routes import process as process_router
 from .routes import files as files_router
 from .routes import runs as runs_router
@@ -22,6 +23,13 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# CSV uploads and JSON summaries compress several times over: accept gzipped
+# request bodies and gzip API responses for clients that ask for it. File
+# downloads are served as-is so they keep Content-Length and range requests
+app.add_middleware(GzipRequestMiddleware)
+app.add_middleware(
+    ExcludePathsGZipMiddleware, exclude_prefixes=("/api/download",), minimum_size=1024
+)
 
 app.include_router(process_router.router, prefix="/api")
 app.include_router(files_router.router, prefix="/api")
@@ -36,7 +44,9 @@ def startup_event():
     """Initialize MongoDB connection if available.
 
     MongoDB is optional - the backend works without it, just won't save history.
+    Also starts the cleaning worker processes in the background.
     """
+    process_router.warm_executor()
     try:
         mongo_uri = cfg.MONGODB_URI
         logger.info(f"MongoDB URI configured: {bool(mongo_uri)} (length: {len(mongo_uri) if mongo_uri else 0})")
@@ -56,7 +66,8 @@ def startup_event():
 
 @app.on_event("shutdown")
 def shutdown_event():
-    """Cleanly close any cached MongoDB client on shutdown."""
+    """Cleanly close any cached MongoDB client and the worker pool on shutdown."""
+    process_router.EXECUTOR.shutdown(wait=True, cancel_futures=True)
     try:
         client = cfg.get_mongo_client()
         if client:
@@ -72,6 +83,22 @@ def healthz():
 
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
 
-    uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop/httptools ship with uvicorn[standard]; uvloop has no Windows
+    # build, so fall back to the stdlib loop / h11 where they're missing
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+    # reload is for local development and can't be combined with workers
+    reload = os.getenv("RELOAD") == "1"
+    uvicorn.run(
+        "src.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=reload,
+        loop=loop,
+        http=http,
+        workers=None if reload else int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
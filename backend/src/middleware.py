@@ -0,0 +1,91 @@
+import zlib
+from typing import Iterable
+
+from starlette.exceptions import HTTPException
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# inflated bodies past this size are refused with 413; a few KB of gzip can
+# otherwise expand to gigabytes
+MAX_INFLATED_BODY_BYTES = 1024 * 1024 * 1024
+
+
+class GzipRequestMiddleware:
+    """Inflate request bodies sent with `Content-Encoding: gzip`.
+
+    The body is decompressed chunk by chunk as the route reads it, so large
+    uploads are never held in memory compressed or whole. Other requests pass
+    through untouched. A body that inflates past `max_body_size` is refused
+    with 413; one that is truncated, has trailing data or holds more than one
+    gzip member with 400.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int = MAX_INFLATED_BODY_BYTES) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = scope["headers"]
+        encoding = next((v for k, v in headers if k == b"content-encoding"), b"")
+        if encoding.strip().lower() != b"gzip":
+            await self.app(scope, receive, send)
+            return
+
+        # the length no longer matches what the route will read
+        scope = dict(scope)
+        scope["headers"] = [
+            (k, v) for k, v in headers if k not in (b"content-encoding", b"content-length")
+        ]
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        inflated = 0
+
+        async def inflated_receive() -> Message:
+            nonlocal inflated
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            data = message.get("body", b"")
+            if data and inflater.eof:
+                raise HTTPException(status_code=400, detail="Invalid gzip request body")
+            remaining = self.max_body_size - inflated
+            try:
+                # one byte past the limit is enough to know it was exceeded
+                body = inflater.decompress(data, remaining + 1)
+            except zlib.error:
+                raise HTTPException(status_code=400, detail="Invalid gzip request body")
+            if len(body) > remaining:
+                raise HTTPException(status_code=413, detail="Request body too large")
+            inflated += len(body)
+            # data after the first member is either garbage or a second member
+            if inflater.unused_data:
+                raise HTTPException(status_code=400, detail="Invalid gzip request body")
+            if not message.get("more_body", False) and not inflater.eof:
+                raise HTTPException(status_code=400, detail="Truncated gzip request body")
+            return {**message, "body": body}
+
+        await self.app(scope, inflated_receive, send)
+
+
+class ExcludePathsGZipMiddleware:
+    """Gzip responses except for the paths starting with `exclude_prefixes`.
+
+    File downloads are left alone: compressing them on the fly drops their
+    Content-Length and range support, and PDFs and zips don't shrink anyway.
+    """
+
+    def __init__(
+        self, app: ASGIApp, exclude_prefixes: Iterable[str] = (), minimum_size: int = 500
+    ) -> None:
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await self.gzip_app(scope, receive, send)
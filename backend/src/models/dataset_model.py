@@ -1,10 +1,12 @@
-from pydantic import BaseModel
-from typing import Any, Dict
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Dict, Optional
 
 
 class ProcessResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     raw_file: str
     cleaned_file: str
-    report_file: str
-    json_summary: str
+    report_file: Optional[str] = None
+    json_summary: Optional[str] = None
     summary: Dict[str, Any]
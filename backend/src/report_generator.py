@@ -1,25 +1,81 @@
 import datetime
 import json
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, LongTable, TableStyle
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+# Built once at import: the sample stylesheet and table style are the same
+# for every report and getSampleStyleSheet() is not cheap
+_STYLES = getSampleStyleSheet()
+
+# Rows per LongTable in the per-column table (see generate_pdf_report)
+TABLE_CHUNK_ROWS = 500
+_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#003f5c")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ]
+)
+
+
+def _column_rows(
+    before_rows: List[Dict[str, Any]], after_rows: List[Dict[str, Any]], max_rows: int
+) -> Tuple[List[List[str]], int]:
+    """Table rows (one per column) and how many columns were cut off.
+
+    Columns keep the order of the before-cleaning summary, which lists the
+    most affected ones first, so a truncated table keeps those; columns only
+    present after cleaning follow.
+    """
+    before = {r["column"]: r for r in before_rows}
+    after = {r["column"]: r for r in after_rows}
+
+    # Insertion-ordered union of the keys, no set or sort
+    columns = list(dict.fromkeys([*before, *after]))
+    data: List[List[str]] = []
+    for col in columns[:max_rows]:
+        b = before.get(col, {})
+        a = after.get(col, {})
+        data.append(
+            [
+                str(col),
+                f"{b.get('missing_pct', '')}%",
+                f"{a.get('missing_pct', '')}%",
+                str(a.get("dtype", "")),
+            ]
+        )
+    return data, max(len(columns) - max_rows, 0)
 
 
 def generate_pdf_report(
-    summary: dict, output_path: str, title: str = "Data Summary Report"
+    summary: dict,
+    output_path: str,
+    title: str = "Data Summary Report",
+    max_rows: int = 10_000,
 ) -> None:
     """
     Generate a simple PDF report summarizing cleaning results.
 
     `summary` is the dict returned by `clean_dataframe` in `cleaner.py`.
+    At most `max_rows` columns are tabulated; the rest are only counted.
     """
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
 
     doc = SimpleDocTemplate(str(output), pagesize=letter)
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     elements = []
 
     elements.append(Paragraph(title, styles["Title"]))
@@ -36,34 +92,28 @@ def generate_pdf_report(
 
     # Table of per-column before/after missing %
     headers = ["Column", "Missing % (before)", "Missing % (after)", "Dtype (after)"]
-    data = [headers]
+    data, omitted = _column_rows(
+        summary.get("missing_summary_before", []),
+        summary.get("missing_summary_after", []),
+        max_rows,
+    )
 
-    before = {r["column"]: r for r in summary.get("missing_summary_before", [])}
-    after = {r["column"]: r for r in summary.get("missing_summary_after", [])}
+    # Splitting one table across pages re-measures all remaining rows at every
+    # break, which goes quadratic for wide datasets; fixed-size tables keep it
+    # linear (each one restarts with the header row)
+    for start in range(0, max(len(data), 1), TABLE_CHUNK_ROWS):
+        table = LongTable(
+            [headers] + data[start:start + TABLE_CHUNK_ROWS],
+            colWidths=[150, 100, 100, 150],
+            repeatRows=1,
+            splitByRow=1,
+        )
+        table.setStyle(_TABLE_STYLE)
+        elements.append(table)
 
-    for col in sorted(set(list(before.keys()) + list(after.keys()))):
-        b = before.get(col, {})
-        a = after.get(col, {})
-        row = [
-            col,
-            f"{b.get('missing_pct', '')}%",
-            f"{a.get('missing_pct', '')}%",
-            a.get("dtype", ""),
-        ]
-        data.append(row)
-
-    table = Table(data, colWidths=[150, 100, 100, 150], repeatRows=1)
-    style = TableStyle(
-        [
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#003f5c")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 9),
-        ]
-    )
-    table.setStyle(style)
-    elements.append(table)
+    if omitted:
+        elements.append(Spacer(1, 6))
+        elements.append(Paragraph(f"… {omitted} more columns omitted", styles["Italic"]))
 
     doc.build(elements)
 
@@ -71,6 +121,23 @@ def generate_pdf_report(
 def save_json_summary(summary: dict, output_path: str) -> None:
     p = Path(output_path)
     p.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        try:
+            p.write_bytes(
+                orjson.dumps(
+                    summary,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS
+                    # keep str() formatting for datetimes, as json.dump does
+                    | orjson.OPT_PASSTHROUGH_DATETIME,
+                    default=str,
+                )
+            )
+            return
+        except TypeError:
+            # e.g. ints beyond 64 bits; the stdlib encoder handles those
+            pass
     with open(p, "w", encoding="utf-8") as f:
         json.dump(summary, f, indent=2, default=str)
 
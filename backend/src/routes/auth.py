@@ -1,30 +1,36 @@
 """Authentication routes"""
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from ..auth import register_user, login_user, verify_token, get_user
 
 router = APIRouter()
 
 
 class RegisterRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     email: EmailStr
     password: str
     name: str = ""
 
 
 class LoginRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     email: EmailStr
     password: str
 
 
 class TokenVerifyRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     token: str
 
 
 @router.post("/auth/register")
-def register(req: RegisterRequest):
+async def register(req: RegisterRequest):
     """Register a new user"""
-    result = register_user(req.email, req.password, req.name)
+    result = await register_user(req.email, req.password, req.name)
     
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["message"])
@@ -33,9 +39,9 @@ def register(req: RegisterRequest):
 
 
 @router.post("/auth/login")
-def login(req: LoginRequest):
+async def login(req: LoginRequest):
     """Login a user"""
-    result = login_user(req.email, req.password)
+    result = await login_user(req.email, req.password)
     
     if not result["success"]:
         raise HTTPException(status_code=401, detail=result["message"])
@@ -1,7 +1,13 @@
 from fastapi import APIRouter, Query, HTTPException
 from fastapi.responses import FileResponse
 from pathlib import Path
+from starlette.background import BackgroundTask
+from typing import List, Tuple
+import os
+import stat
+import tempfile
 import urllib.parse
+import zipfile
 
 router = APIRouter()
 
@@ -18,16 +24,27 @@ SERVE_DIRS = {
     "raw": RAW_DIR,
 }
 
+# kind -> (directory, resolved prefix) computed once; the trailing separator
+# keeps e.g. "reports_old/" from passing as being inside "reports/"
+SERVE_DIRS_RESOLVED = {
+    kind: (path, str(path.resolve()) + os.sep) for kind, path in SERVE_DIRS.items()
+}
+
 
-def _safe_resolve(dir_path: Path, filename: str) -> Path:
+def _safe_resolve(dir_path: Path, prefix: str, filename: str) -> Tuple[Path, os.stat_result]:
     # prevent path traversal
     decoded = urllib.parse.unquote(filename)
     candidate = (dir_path / decoded).resolve()
-    if not str(candidate).startswith(str(dir_path.resolve())):
+    if not str(candidate).startswith(prefix):
         raise HTTPException(status_code=400, detail="Invalid filename")
-    if not candidate.exists():
+    # one stat serves both the existence check and the response headers
+    try:
+        st = candidate.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail="File not found")
+    if not stat.S_ISREG(st.st_mode):
         raise HTTPException(status_code=404, detail="File not found")
-    return candidate
+    return candidate, st
 
 
 @router.get("/download")
@@ -38,8 +55,49 @@ def download(kind: str = Query("processed"), filename: str = Query(...)):
       - kind: one of [processed, reports, raw]
       - filename: filename to download (URL-encoded safe)
     """
-    if kind not in SERVE_DIRS:
+    if kind not in SERVE_DIRS_RESOLVED:
         raise HTTPException(status_code=400, detail="Invalid kind")
-    base = SERVE_DIRS[kind]
-    target = _safe_resolve(base, filename)
-    return FileResponse(path=str(target), filename=target.name)
+    base, prefix = SERVE_DIRS_RESOLVED[kind]
+    target, st = _safe_resolve(base, prefix, filename)
+    # with stat_result given, FileResponse sets Content-Length up front and
+    # skips its own stat of the file
+    return FileResponse(path=str(target), filename=target.name, stat_result=st)
+
+
+@router.get("/download/bundle")
+def download_bundle(
+    processed: List[str] = Query([]),
+    reports: List[str] = Query([]),
+):
+    """Download several files as one zip, e.g. all of a run's artifacts.
+
+    Query params:
+      - processed / reports: filenames (repeatable) from those directories
+    """
+    targets = []
+    for kind, filenames in (("processed", processed), ("reports", reports)):
+        base, prefix = SERVE_DIRS_RESOLVED[kind]
+        for filename in filenames:
+            targets.append(_safe_resolve(base, prefix, filename)[0])
+    if not targets:
+        raise HTTPException(status_code=400, detail="No files requested")
+
+    # One response instead of a request per file; level 1 since CSVs
+    # compress well even at the fastest setting. The zip is built in a temp
+    # file, not memory, and removed once it has been sent
+    fd, zip_path = tempfile.mkstemp(suffix=".zip")
+    try:
+        with os.fdopen(fd, "wb") as fh, zipfile.ZipFile(
+            fh, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
+            for target in targets:
+                zf.write(target, arcname=target.name)
+    except BaseException:
+        os.unlink(zip_path)
+        raise
+    return FileResponse(
+        path=zip_path,
+        filename="cleandatapro_run.zip",
+        media_type="application/zip",
+        background=BackgroundTask(os.unlink, zip_path),
+    )
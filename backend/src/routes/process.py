@@ -1,14 +1,21 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+import anyio
+import asyncio
+import functools
+import multiprocessing
 import uuid
 import sys
 import os
 
 from .. import cleaner as cleaner_mod
 from .. import report_generator as report_mod
+from . import runs as runs_mod
 from ..config import get_mongo_client, MONGODB_URI
-from ..auth import verify_token
+from ..auth import bearer_token, verify_token
 
 # Add parent directory to path for utils import
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
@@ -25,23 +32,127 @@ REPORTS_DIR = Path(__file__).resolve().parents[3] / "reports"
 for d in (RAW_DIR, PROCESSED_DIR, REPORTS_DIR):
     d.mkdir(parents=True, exist_ok=True)
 
+# bytes read from the upload per write to data/raw
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# report artifacts /process can write (see its `formats` query param)
+REPORT_FORMATS = frozenset({"pdf", "json"})
+
+PROCESS_WORKERS = os.cpu_count() or 1
+
+
+def _init_worker() -> None:
+    """Pool initializer: import the heavy libraries once per worker process."""
+    import pandas  # noqa: F401
+    import reportlab.platypus  # noqa: F401
+
+
+# forkserver starts workers from a clean single-threaded process instead of
+# forking this one mid-request (with its thread pools and Mongo monitors);
+# Windows only has spawn
+_MP_CONTEXT = None
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _MP_CONTEXT = multiprocessing.get_context("forkserver")
+    # Import the heavy libraries and the job modules once in the server so
+    # every worker forks with them loaded. Not this module: importing it
+    # would build a second executor inside the server. Modules that fail to
+    # import here are skipped and loaded by each worker instead
+    _MP_CONTEXT.set_forkserver_preload(
+        ["pandas", "pyarrow", "reportlab.platypus", cleaner_mod.__name__, report_mod.__name__]
+    )
+
+
+def _new_executor() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=PROCESS_WORKERS, mp_context=_MP_CONTEXT, initializer=_init_worker
+    )
+
+
+# Cleaning and PDF building are CPU-bound pandas/ReportLab work; running them
+# in worker processes keeps the event loop free and lets uploads use every
+# core. main.py warms this up at startup and shuts it down.
+EXECUTOR = _new_executor()
+
+
+def warm_executor() -> None:
+    """Start every worker now so the first upload doesn't pay for the imports."""
+    for _ in range(PROCESS_WORKERS):
+        EXECUTOR.submit(os.getpid)
+
+
+async def _run_in_pool(fn, *args):
+    """Run `fn(*args)` on EXECUTOR, retrying once on a fresh pool if it broke.
+
+    A worker that dies (OOM kill, segfault) marks the whole pool broken and
+    every later submit would fail; swap in a new pool instead. A job that
+    breaks the replacement too raises BrokenProcessPool to the caller.
+    """
+    global EXECUTOR
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        executor = EXECUTOR
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # concurrent requests see the same broken pool; only replace it once
+            if EXECUTOR is executor:
+                logger.warning("Worker pool broke; starting a new one")
+                EXECUTOR = _new_executor()
+                executor.shutdown(wait=False, cancel_futures=True)
+            if attempt:
+                raise
+
+
+def _persist_run(doc: dict) -> None:
+    """Insert a run document into `clean_runs` (best-effort: failures are only logged)."""
+    try:
+        client = get_mongo_client()
+        if client:
+            # prefer default database from URI, else use a sensible default
+            try:
+                db = client.get_default_database()
+            except Exception:
+                db = client["cleandatapro"]
+
+            db["clean_runs"].insert_one(doc)
+            logger.info("Persisted run summary to MongoDB (run_id=%s)", doc["run_id"])
+    except Exception as e:
+        logger.warning("Failed to persist summary to MongoDB: %s", e)
+    # Do NOT close the client here. `get_mongo_client()` returns a cached client
+    # which should remain open for the lifetime of the application. Closing it
+    # would prevent subsequent requests from reusing the connection.
+
 
 @router.post("/process")
-async def process_upload(request: Request, file: UploadFile = File(...)):
-    """Accept a CSV upload, clean it and return JSON summary + paths to artifacts."""
+async def process_upload(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    formats: str = Query("pdf,json"),
+):
+    """Accept a CSV upload, clean it and return JSON summary + paths to artifacts.
+
+    `formats` is a comma-separated subset of `pdf,json` naming the report
+    artifacts to write; skipped ones come back as null paths.
+    """
     # validate filename exists and is a CSV
     if not file.filename or not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are supported")
 
+    wanted = {f.strip().lower() for f in formats.split(",") if f.strip()}
+    if not wanted <= REPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="formats must be a subset of: pdf,json")
+
     # save uploaded file to data/raw with a unique name
     uid = uuid.uuid4().hex[:8]
     raw_name = f"{Path(file.filename).stem}_{uid}.csv"
     raw_path = RAW_DIR / raw_name
 
     try:
-        with raw_path.open("wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # Copy in bounded chunks so memory stays flat and writes don't block the loop
+        async with await anyio.open_file(raw_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
     except Exception as e:
         logger.error("Failed to save uploaded file: %s", e)
         raise HTTPException(status_code=500, detail="Failed to save uploaded file")
@@ -49,8 +160,11 @@ async def process_upload(request: Request, file: UploadFile = File(...)):
     # clean the CSV file on disk using cleaner.clean_csv which reads/writes files
     processed_name = f"{Path(file.filename).stem}_{uid}_cleaned.csv"
     processed_path = PROCESSED_DIR / processed_name
+    loop = asyncio.get_running_loop()
     try:
-        summary = cleaner_mod.clean_csv(str(raw_path), str(processed_path))
+        summary = await _run_in_pool(
+            cleaner_mod.clean_csv, str(raw_path), str(processed_path)
+        )
     except FileNotFoundError as e:
         logger.error("Failed to read uploaded CSV: %s", e)
         raise HTTPException(status_code=400, detail=f"Failed to parse CSV: {e}")
@@ -64,61 +178,68 @@ async def process_upload(request: Request, file: UploadFile = File(...)):
     json_name = f"{Path(file.filename).stem}_{uid}_summary.json"
     json_path = REPORTS_DIR / json_name
 
-    try:
-        report_mod.generate_pdf_report(
-            summary, str(report_path), title=f"Summary: {file.filename}"
+    # The two artifacts are independent: build the PDF in the process pool
+    # while the (cheap, I/O-bound) JSON dump runs on a thread. The PDF is by
+    # far the slower one, so callers that only want JSON can skip it.
+    jobs = []
+    if "pdf" in wanted:
+        jobs.append(
+            _run_in_pool(
+                functools.partial(
+                    report_mod.generate_pdf_report,
+                    summary,
+                    str(report_path),
+                    title=f"Summary: {file.filename}",
+                )
+            )
+        )
+    if "json" in wanted:
+        jobs.append(
+            loop.run_in_executor(
+                None, report_mod.save_json_summary, summary, str(json_path)
+            )
         )
-        report_mod.save_json_summary(summary, str(json_path))
+    try:
+        await asyncio.gather(*jobs)
     except Exception as e:
         logger.exception("Failed to generate report: %s", e)
         raise HTTPException(status_code=500, detail="Failed to generate report")
 
+    if "json" in wanted:
+        # /runs can serve this summary without re-reading the file
+        runs_mod.remember_summary(json_path, summary)
+    report_file = str(report_path.as_posix()) if "pdf" in wanted else None
+    json_file = str(json_path.as_posix()) if "json" in wanted else None
+
     # Try to determine user from Bearer token (optional)
     user_email = None
     try:
-        auth_header = request.headers.get("authorization") or request.headers.get("Authorization")
-        if auth_header and auth_header.lower().startswith("bearer "):
-            token = auth_header.split(" ", 1)[1].strip()
+        token = bearer_token(request.headers.get("authorization"))
+        if token is not None:
             user_email = verify_token(token)
     except Exception:
         user_email = None
 
-    # Try to persist run summary to MongoDB (best-effort: failures won't block response)
+    # Persist the run summary to MongoDB after the response has been sent;
+    # it's best-effort, so the client shouldn't wait on the round trip
     if MONGODB_URI:
-        try:
-            client = get_mongo_client()
-            if client:
-                # prefer default database from URI, else use a sensible default
-                try:
-                    db = client.get_default_database()
-                except Exception:
-                    db = client["cleandatapro"]
-
-                coll = db["clean_runs"]
-                doc = {
-                    "raw_file": str(raw_path.as_posix()),
-                    "cleaned_file": str(processed_path.as_posix()),
-                    "report_file": str(report_path.as_posix()),
-                    "json_summary": str(json_path.as_posix()),
-                    "summary": summary,
-                    "uploaded_filename": file.filename,
-                    "run_id": uid,
-                    "user_email": user_email,
-                }
-                coll.insert_one(doc)
-                logger.info("Persisted run summary to MongoDB (run_id=%s)", uid)
-        except Exception as e:
-            # best-effort: log but don't fail the request
-            logger.warning("Failed to persist summary to MongoDB: %s", e)
-        # Do NOT close the client here. `get_mongo_client()` returns a cached client
-        # which should remain open for the lifetime of the application. Closing it
-        # would prevent subsequent requests from reusing the connection.
+        doc = {
+            "raw_file": str(raw_path.as_posix()),
+            "cleaned_file": str(processed_path.as_posix()),
+            "report_file": report_file,
+            "json_summary": json_file,
+            "summary": summary,
+            "uploaded_filename": file.filename,
+            "run_id": uid,
+            "user_email": user_email,
+        }
+        background_tasks.add_task(_persist_run, doc)
 
     resp = {
         "raw_file": str(raw_path.as_posix()),
         "cleaned_file": str(processed_path.as_posix()),
-        "report_file": str(report_path.as_posix()),
-        "json_summary": str(json_path.as_posix()),
+        "report_file": report_file,
+        "json_summary": json_file,
         "summary": summary,
     }
 
@@ -1,10 +1,16 @@
 from fastapi import APIRouter, Request, HTTPException
 from pathlib import Path
 import json
-from typing import List, Dict, Any
+import os
+from typing import List, Dict, Any, Tuple
 
 from ..config import get_mongo_client, MONGODB_URI
-from ..auth import verify_token
+from ..auth import bearer_token, verify_token
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 router = APIRouter()
 
@@ -12,19 +18,79 @@ BASE_DIR = Path(__file__).resolve().parents[3]
 REPORTS_DIR = BASE_DIR / "reports"
 
 
+# History listings only show run-level totals; the per-column arrays are the
+# bulk of each document, so leave them on the server
+_RUNS_PROJECTION = {
+    "summary.missing_summary_before": 0,
+    "summary.missing_summary_after": 0,
+}
+_runs_index_ready = False
+
+
+def _ensure_runs_index(coll) -> None:
+    """Index clean_runs for the per-user newest-first listing (once per process)."""
+    global _runs_index_ready
+    if _runs_index_ready:
+        return
+    try:
+        # No-op when the index already exists
+        coll.create_index([("user_email", 1), ("_id", -1)])
+        _runs_index_ready = True
+    except Exception:
+        # best-effort: the query still works without it
+        pass
+
+
+# Parsed summaries by path: (mtime_ns, data). Files are only re-read when
+# they change, so /runs doesn't parse the whole reports dir per request.
+_SUMMARY_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def remember_summary(path: Path, summary: Dict[str, Any]) -> None:
+    """Seed the cache with a summary that was just written to `path`."""
+    try:
+        _SUMMARY_CACHE[str(path)] = (path.stat().st_mtime_ns, summary)
+    except OSError:
+        pass
+
+
 def _read_json_summaries() -> List[Dict[str, Any]]:
     out = []
-    for p in sorted(REPORTS_DIR.glob("*_summary.json")):
+    seen = set()
+    # scandir + endswith: one readdir pass with no fnmatch or per-entry Path
+    try:
+        with os.scandir(REPORTS_DIR) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith("_summary.json")), key=lambda e: e.name
+            )
+    except FileNotFoundError:
+        entries = []
+    for entry in entries:
+        path = entry.path
+        seen.add(path)
         try:
-            with open(p, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                metadata = {
-                    "json_file": str(p.as_posix()),
-                    "summary": data,
-                }
-                out.append(metadata)
+            mtime = entry.stat().st_mtime_ns
+            cached = _SUMMARY_CACHE.get(path)
+            if cached is not None and cached[0] == mtime:
+                data = cached[1]
+            else:
+                if orjson is not None:
+                    with open(path, "rb") as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                _SUMMARY_CACHE[path] = (mtime, data)
+            metadata = {
+                "json_file": path.replace(os.sep, "/"),
+                "summary": data,
+            }
+            out.append(metadata)
         except Exception:
             continue
+    # Forget files that were deleted since the last listing
+    for path in [p for p in _SUMMARY_CACHE if p not in seen]:
+        _SUMMARY_CACHE.pop(path, None)
     return out
 
 
@@ -37,11 +103,11 @@ def list_runs(request: Request, limit: int = 50):
     """
     if MONGODB_URI:
         # Require auth for per-user history when MongoDB is configured
-        auth_header = request.headers.get("authorization") or request.headers.get("Authorization")
-        if not auth_header or not auth_header.lower().startswith("bearer "):
+        # Starlette header lookup is case-insensitive
+        token = bearer_token(request.headers.get("authorization"))
+        if token is None:
             raise HTTPException(status_code=401, detail="Missing bearer token")
 
-        token = auth_header.split(" ", 1)[1].strip()
         email = verify_token(token)
         if not email:
             raise HTTPException(status_code=401, detail="Invalid token")
@@ -53,9 +119,10 @@ def list_runs(request: Request, limit: int = 50):
                     db = client.get_default_database()
                 except Exception:
                     db = client["cleandatapro"]
+                coll = db["clean_runs"]
+                _ensure_runs_index(coll)
                 docs = list(
-                    db["clean_runs"]
-                    .find({"user_email": email})
+                    coll.find({"user_email": email}, _RUNS_PROJECTION)
                     .sort("_id", -1)
                     .limit(limit)
                 )
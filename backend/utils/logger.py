@@ -10,15 +10,18 @@ except Exception:
 def get_logger(
     name: str = __name__, level: int = logging.INFO, use_rich: Optional[bool] = True
 ) -> logging.Logger:
-    handlers = []
-    if use_rich and RichHandler is not None:
-        handlers.append(RichHandler())
-    else:
-        handlers.append(logging.StreamHandler())
+    # basicConfig is a no-op once the root logger has handlers, so only build
+    # a handler the first time instead of on every call
+    if not logging.getLogger().handlers:
+        handlers = []
+        if use_rich and RichHandler is not None:
+            handlers.append(RichHandler())
+        else:
+            handlers.append(logging.StreamHandler())
 
-    logging.basicConfig(
-        level=level, format="%(asctime)s %(levelname)s %(message)s", handlers=handlers
-    )
+        logging.basicConfig(
+            level=level, format="%(asctime)s %(levelname)s %(message)s", handlers=handlers
+        )
     logger = logging.getLogger(name)
     logger.setLevel(level)
     return logger
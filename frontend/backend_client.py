@@ -0,0 +1,81 @@
+"""Backend HTTP helpers shared by the Streamlit and Flask frontends"""
+import functools
+import os
+import zlib
+from typing import BinaryIO, Iterator, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.fields import RequestField
+from urllib3.util.retry import Retry
+
+
+BACKEND_BASE = os.environ.get("CLEAN_DATAPRO_BACKEND", "http://localhost:8000")
+
+# bytes of the upload per chunk of the body sent to the backend
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def http_session() -> requests.Session:
+    """One pooled session per process so backend calls reuse connections.
+
+    Retries cover failed connects and gateway errors on idempotent requests
+    only, so a login or upload POST that reached the backend is never sent
+    twice. raise_on_status=False hands back the last response once retries
+    run out, so callers' status checks still see it.
+    """
+    s = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+def _multipart_parts(
+    name: str, data: Union[bytes, BinaryIO], boundary: str
+) -> Iterator[bytes]:
+    field = RequestField(name="file", data=b"", filename=name)
+    field.make_multipart(content_type="text/csv")
+    yield f"--{boundary}\r\n".encode() + field.render_headers().encode()
+    if isinstance(data, bytes):
+        view = memoryview(data)
+        for i in range(0, len(view), UPLOAD_CHUNK_SIZE):
+            yield view[i:i + UPLOAD_CHUNK_SIZE]
+    else:
+        while chunk := data.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+    yield f"\r\n--{boundary}--\r\n".encode()
+
+
+def multipart_body(
+    name: str, data: Union[bytes, BinaryIO], boundary: str, compress: bool = False
+) -> Iterator[bytes]:
+    """Yield a multipart/form-data body holding `data` (bytes or a binary
+    file object) as the CSV field "file".
+
+    The upload goes out a chunk at a time, so the whole body is never built in
+    memory (requests' files= would). With `compress` each chunk is gzipped on
+    the way, for a request sent with `Content-Encoding: gzip`.
+    """
+    parts = _multipart_parts(name, data, boundary)
+    if not compress:
+        yield from parts
+        return
+    # level 1 is much faster than the default for nearly the same ratio on CSV
+    gz = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for part in parts:
+        chunk = gz.compress(part)
+        # an empty chunk would end a chunked request early
+        if chunk:
+            yield chunk
+    yield gz.flush()
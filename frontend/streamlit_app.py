@@ -1,13 +1,18 @@
 import streamlit as st
 import requests
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import os
-from urllib.parse import quote
+import functools
+import heapq
+from pathlib import PurePosixPath
+from urllib3.filepost import choose_boundary
 from io import BytesIO
 import time
 from auth_pages import show_login_page, show_logout_button, require_auth
+from backend_client import BACKEND_BASE, http_session, multipart_body
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 # Page config
 st.set_page_config(
@@ -30,8 +35,15 @@ if "name" not in st.session_state:
 # Require authentication before loading the dashboard
 require_auth()
 
+# Imported only once signed in: the login page doesn't need them, and a cold
+# start shouldn't spend half a second on them before it can render
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
 # Custom CSS for better styling
-st.markdown("""
+_APP_CSS = """
 <style>
     .metric-card {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -60,9 +72,12 @@ st.markdown("""
         border-color: #c82333 !important;
     }
 </style>
-""", unsafe_allow_html=True)
-
-BACKEND_BASE = os.environ.get("CLEAN_DATAPRO_BACKEND", "http://localhost:8000")
+"""
+# Emitted on every run: Streamlit drops whatever a rerun doesn't re-send, so
+# gating this on session state would lose the styles after the first click.
+# st.html sends a style-only block straight to the page without markdown
+# parsing, and it takes no space in the layout.
+st.html(_APP_CSS)
 
 
 def _auth_headers() -> dict:
@@ -120,34 +135,124 @@ with st.sidebar:
     """)
 
 # Helper functions
-def _basename_posix(path):
-    if not path:
-        return None
-    return path.split("/")[-1]
 
-def process_file(uploaded_file):
-    """Process uploaded CSV file"""
+def _json(resp: requests.Response):
+    """Decode a backend JSON response, with orjson when it is installed.
+
+    The run summaries carry a dict per dataset column, which orjson parses
+    a few times faster than the stdlib decoder behind resp.json().
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+_DOWNLOAD_URL = f"{BACKEND_BASE}/api/download"
+
+# (response key, /api/download kind, button label, mime type) per run artifact
+_DOWNLOAD_LINKS = (
+    ("cleaned_file", "processed", "📥 Download Cleaned CSV", "text/csv"),
+    ("report_file", "reports", "📄 Download PDF Report", "application/pdf"),
+    ("json_summary", "reports", "📊 Download JSON Summary", "application/json"),
+)
+
+def _fetch_artifact(kind: str, filename: str) -> bytes:
+    """Fetch one run artifact from the backend."""
+    # st.download_button can't take a stream, so the whole file passes through
+    # this process, once per click. It isn't cached: a process-wide cache would
+    # hold every session's CSVs and PDFs for its TTL, readable by any session
+    # that knew the file name. Don't fetch
+    # artifacts anywhere else: if one ever needs to be relayed without
+    # download_button, use stream=True and iter_content(chunk_size=1 << 16)
+    # rather than .content, or link the browser to /api/download directly.
+    resp = http_session().get(
+        _DOWNLOAD_URL,
+        params={"kind": kind, "filename": filename},
+        timeout=60
+    )
+    resp.raise_for_status()
+    return resp.content
+
+def _fetch_bundle(files: tuple) -> bytes:
+    """Fetch several artifacts as one zip; `files` is ((kind, filename), ...).
+
+    Not cached, for the same reasons as `_fetch_artifact`.
+    """
+    resp = http_session().get(
+        f"{_DOWNLOAD_URL}/bundle",
+        params=list(files),
+        # already deflated; skip gzipping it a second time in transit
+        headers={"Accept-Encoding": "identity"},
+        timeout=60
+    )
+    resp.raise_for_status()
+    return resp.content
+
+def _process_upload(name: str, payload: bytes, token) -> dict:
+    """POST a CSV to /api/process and return the run it recorded.
+
+    Deliberately not cached: every click on Process is a new run on the
+    backend (new artifacts, a new History entry). The local preview is
+    what's cached, see `_preview_csv`.
+    """
+    # CSV shrinks several times over, so the body goes up gzipped (the backend
+    # inflates it) and streamed with chunked transfer encoding
+    boundary = choose_boundary()
+    headers = {
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+        "Content-Encoding": "gzip",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    resp = http_session().post(
+        f"{BACKEND_BASE}/api/process",
+        data=multipart_body(name, payload, boundary, compress=True),
+        headers=headers,
+        # fail fast on connect, but give large files time to clean
+        timeout=(5, 300)
+    )
+    resp.raise_for_status()
+    return _json(resp)
+
+def _improvement_pct(summary: dict) -> float:
+    """Share of the missing values that cleaning filled, in percent."""
+    mb = summary.get("missing_before", 0)
+    ma = summary.get("missing_after", 0)
+    return (mb - ma) / mb * 100 if mb > 0 else 0.0
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_runs(limit: int, token, refreshes: int = 0) -> dict:
+    """GET /api/runs; cached briefly so widget reruns on the History page
+    don't each go back to the backend. Keyed on the token, as runs are per user.
+
+    `refreshes` only busts the cache: bumping it for one session fetches
+    fresh runs without clearing everyone else's entries.
+    """
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    resp = http_session().get(
+        f"{BACKEND_BASE}/api/runs",
+        params={"limit": limit},
+        headers=headers,
+        timeout=10,
+    )
+    resp.raise_for_status()
+    return _json(resp)
+
+def process_file(name: str, payload: bytes):
+    """Process an uploaded CSV file's `payload`"""
     st.session_state.processing = True
     
     with st.spinner("🔄 Processing your file..."):
         try:
-            files = {"file": (uploaded_file.name, uploaded_file.getvalue(), "text/csv")}
-            resp = requests.post(
-                f"{BACKEND_BASE}/api/process",
-                files=files,
-                headers=_auth_headers(),
-                timeout=60
-            )
-            
-            if resp.status_code != 200:
-                st.error(f"❌ Backend Error: {resp.status_code}")
-                st.error(resp.text)
-                return None
+            result = _process_upload(name, payload, st.session_state.get("token"))
             
-            st.session_state.last_result = resp.json()
+            st.session_state.last_result = result
             st.session_state.processing = False
-            return resp.json()
+            return result
         
+        except requests.exceptions.HTTPError as e:
+            st.error(f"❌ Backend Error: {e.response.status_code}")
+            st.error(e.response.text)
+            return None
         except requests.exceptions.ConnectionError:
             st.error("❌ Cannot connect to backend. Is the FastAPI server running?")
             return None
@@ -155,9 +260,45 @@ def process_file(uploaded_file):
             st.error(f"❌ Error: {str(e)}")
             return None
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def _preview_csv(payload: bytes):
+    """(shape, first 10 rows) of an upload, cached on the file content.
+
+    Only the head is parsed in full; the row count comes from a pass that
+    converts just the first column, about half the cost of a full parse.
+    """
+    head = pd.read_csv(BytesIO(payload), nrows=10)
+    rows = len(pd.read_csv(BytesIO(payload), usecols=[0]))
+    return (rows, len(head.columns)), head
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _column_info(payload: bytes):
+    """Per-column type, missing and unique counts; needs the whole file parsed."""
+    df = pd.read_csv(BytesIO(payload))
+    return pd.DataFrame({
+        "Column": df.columns,
+        "Type": [str(t) for t in df.dtypes],
+        "Missing": df.isna().sum().to_numpy(),
+        "Unique": df.nunique().to_numpy(),
+    })
+
+def _align_on_column(before, after):
+    """Put `after` beside `before`, one row per column of the dataset.
+
+    Each side has one row per column, so this is an index join. Cleaning never
+    adds columns, so `after` is reindexed onto `before`'s with 0 for any gap:
+    nothing comes out NaN and no fillna pass is needed.
+    """
+    before = before.set_index("column")
+    after = after.set_index("column").reindex(before.index, fill_value=0)
+    return pd.concat([before, after], axis=1).reset_index()
+
 def display_summary_metrics(data):
     """Display summary metrics in columns"""
     summary = data.get("summary", {})
+    duplicates = summary.get("dropped_duplicates", 0)
+    original_missing = summary.get("missing_before", 0)
+    cleaned_missing = summary.get("missing_after", 0)
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -172,19 +313,17 @@ def display_summary_metrics(data):
         st.metric(
             "✅ Cleaned Rows",
             f"{summary.get('cleaned_rows', 'N/A'):,}",
-            delta=f"-{summary.get('dropped_duplicates', 0)} duplicates"
+            delta=f"-{duplicates} duplicates"
         )
     
     with col3:
         st.metric(
             "🗑️ Removed",
-            f"{summary.get('dropped_duplicates', 0):,}",
+            f"{duplicates:,}",
             delta="duplicates"
         )
     
     with col4:
-        original_missing = summary.get("missing_before", 0)
-        cleaned_missing = summary.get("missing_after", 0)
         improvement = original_missing - cleaned_missing if original_missing > 0 else 0
         st.metric(
             "📊 Missing Values Fixed",
@@ -192,6 +331,31 @@ def display_summary_metrics(data):
             delta=None
         )
 
+@st.cache_data(show_spinner=False)
+def _missing_counts_chart(names: tuple, before: tuple, after: tuple) -> go.Figure:
+    """Before/after missing-count bar chart, built once per distinct result."""
+    # Grouped bar chart from plain long-form lists: all "Before" rows, then
+    # all "After" rows; px.bar needs no DataFrame for this
+    counts = list(before) + list(after)
+    fig = px.bar(
+        x=list(names) * 2,
+        y=counts,
+        color=["Before"] * len(names) + ["After"] * len(names),
+        labels={"x": "Column", "y": "Missing Values", "color": "Stage"},
+        title="Missing Values: Before vs After Cleaning",
+        barmode="group",
+        color_discrete_map={"Before": "#ef553b", "After": "#00cc96"},
+        text=counts
+    )
+    fig.update_traces(texttemplate='%{text}', textposition='outside')
+    fig.update_layout(
+        height=400, 
+        hovermode="x unified",
+        yaxis_title="Number of Missing Values",
+        xaxis_title="Column"
+    )
+    return fig
+
 def display_missing_analysis(data):
     """Display before/after missing data analysis"""
     summary = data.get("summary", {})
@@ -208,17 +372,15 @@ def display_missing_analysis(data):
     if df_before.empty:
         return
     
-    # Merge before/after data with missing counts (not just percentages)
-    merged = pd.merge(
+    # Align before/after data with missing counts (not just percentages)
+    merged = _align_on_column(
         df_before[["column", "missing_count", "missing_pct"]].rename(
             columns={"missing_count": "Count Before", "missing_pct": "Before (%)"}
         ),
         df_after[["column", "missing_count", "missing_pct"]].rename(
             columns={"missing_count": "Count After", "missing_pct": "After (%)"}
         ),
-        on="column",
-        how="outer",
-    ).fillna(0)
+    )
     
     # Add a column for improvement
     merged["Fixed"] = merged["Count Before"] - merged["Count After"]
@@ -234,43 +396,185 @@ def display_missing_analysis(data):
     # Create visualization showing missing counts (more visible than percentages)
     st.markdown("**Missing Values Count Comparison:**")
     
-    # Prepare data for grouped bar chart
-    chart_data = []
-    for _, row in merged.iterrows():
-        chart_data.append({
-            "Column": str(row["column"]),
-            "Stage": "Before",
-            "Count": int(row["Count Before"]) if pd.notna(row["Count Before"]) else 0
-        })
-        chart_data.append({
-            "Column": str(row["column"]),
-            "Stage": "After",
-            "Count": int(row["Count After"]) if pd.notna(row["Count After"]) else 0
-        })
-    
-    chart_df = pd.DataFrame(chart_data)
-    # Ensure Count is integer type
-    chart_df["Count"] = chart_df["Count"].astype(int)
-    
+    fig = _missing_counts_chart(
+        tuple(merged["column"].astype(str)),
+        tuple(merged["Count Before"].astype(int)),
+        tuple(merged["Count After"].astype(int)),
+    )
+    st.plotly_chart(fig, width='stretch')
+
+# Analytics page figures. Each is cached on its (hashable) inputs, so reruns
+# for the same result skip building the figure again. Percentages go in as
+# float32: Plotly ships numeric arrays as typed binary, and single precision
+# halves those bytes with no visible difference on a 0-100 axis.
+
+# Per-column charts show at most this many (the worst) columns; one bar per
+# column of a very wide dataset bloats the page and stalls the browser
+MAX_CHART_COLUMNS = 100
+
+def _shown_of(shown: int, total: int) -> str:
+    """Note for a per-column chart that was cut down ("" when it wasn't)."""
+    return f"Worst {shown} of {total} columns" if shown < total else ""
+
+@st.cache_data(show_spinner=False)
+def _loss_pie_chart(fixed, remaining) -> go.Figure:
+    fig = go.Figure(data=[
+        go.Pie(
+            labels=["Fixed", "Remaining"],
+            values=[fixed, remaining],
+            hole=0.4,
+            marker=dict(colors=["#00cc96", "#ef553b"]),
+            hovertemplate="<b>%{label}</b><br>Count: %{value}<br>%{percent}<extra></extra>"
+        )
+    ])
+    fig.update_layout(height=400, margin=dict(l=0, r=0, t=30, b=0))
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _row_stages_chart(original, deduplicated, cleaned) -> go.Figure:
+    df_rows = pd.DataFrame({
+        "Stage": ["Original Data", "After Duplicate Removal", "Final Cleaned"],
+        "Rows": [original, deduplicated, cleaned]
+    })
     fig = px.bar(
-        chart_df,
-        x="Column",
-        y="Count",
+        df_rows,
+        x="Stage",
+        y="Rows",
+        text="Rows",
         color="Stage",
-        labels={"Count": "Missing Values"},
+        color_discrete_sequence=["#667eea", "#ef553b", "#00cc96"]
+    )
+    fig.update_traces(textposition='outside')
+    fig.update_layout(height=400, showlegend=False, 
+                     yaxis_title="Row Count",
+                     xaxis_title="",
+                     margin=dict(l=0, r=0, t=30, b=0))
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _column_types_chart(numeric, categorical) -> go.Figure:
+    fig = go.Figure(data=[
+        go.Bar(
+            x=["Numeric", "Categorical"],
+            y=[numeric, categorical],
+            text=[numeric, categorical],
+            textposition='outside',
+            marker=dict(color=["#00cc96", "#667eea"])
+        )
+    ])
+    fig.update_layout(height=400, showlegend=False, 
+                     xaxis_title="", yaxis_title="Count",
+                     margin=dict(l=0, r=0, t=30, b=0))
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _quality_score_chart(columns: tuple, scores: tuple) -> go.Figure:
+    df = pd.DataFrame({"column": columns, "Quality Score": np.asarray(scores, dtype=np.float32)})
+    shown = df.nsmallest(MAX_CHART_COLUMNS, "Quality Score")
+    fig = px.bar(
+        shown.sort_values("Quality Score"),
+        x="Quality Score",
+        y="column",
+        orientation="h",
+        color="Quality Score",
+        color_continuous_scale="RdYlGn",
+        range_color=[0, 100],
+        title=" - ".join(filter(None, ["Data Quality Score by Column", _shown_of(len(shown), len(df))])),
+        labels={"column": "Column", "Quality Score": "Quality Score (%)"}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+def _completeness(missing_pct: tuple) -> tuple:
+    """((column, completeness %), ...) from ((column, missing %), ...) pairs."""
+    return tuple((c, 100 - p) for c, p in missing_pct)
+
+@st.cache_data(show_spinner=False)
+def _completeness_chart(completeness: tuple) -> go.Figure:
+    df = pd.DataFrame(completeness, columns=["Column", "Completeness (%)"]).astype(
+        {"Completeness (%)": np.float32}
+    )
+    shown = df.nsmallest(MAX_CHART_COLUMNS, "Completeness (%)")
+    fig = px.bar(
+        shown.sort_values("Completeness (%)", ascending=True),
+        x="Completeness (%)",
+        y="Column",
+        orientation="h",
+        color="Completeness (%)",
+        color_continuous_scale="RdYlGn",
+        range_color=[0, 100],
+        text="Completeness (%)"
+    )
+    fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+    fig.update_layout(height=400, xaxis_title="Completeness (%)")
+    if len(shown) < len(df):
+        fig.update_layout(title=_shown_of(len(shown), len(df)))
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _missing_trend_chart(before: tuple, after: tuple) -> go.Figure:
+    """Before/after missing % bar chart, built once per distinct summary.
+
+    `before`/`after` are ((column, missing_pct), ...) tuples so they hash cheaply.
+    """
+    # Plain lists in long form (before rows, then after rows) are all px.bar
+    # needs; no DataFrame to build, join or melt
+    cols = [c for c, _ in before]
+    after_map = dict(after)
+    fig = px.bar(
+        x=cols * 2,
+        y=np.array(
+            [p for _, p in before] + [after_map.get(c, 0) for c in cols], dtype=np.float32
+        ),
+        color=["Missing Before (%)"] * len(cols) + ["Missing After (%)"] * len(cols),
+        labels={"x": "column", "y": "Missing Percentage (%)", "color": "Stage"},
         title="Missing Values: Before vs After Cleaning",
         barmode="group",
-        color_discrete_map={"Before": "#ef553b", "After": "#00cc96"},
-        text="Count"
-    )
-    fig.update_traces(texttemplate='%{text}', textposition='outside')
-    fig.update_layout(
-        height=400, 
-        hovermode="x unified",
-        yaxis_title="Number of Missing Values",
-        xaxis_title="Column"
+        color_discrete_map={
+            "Missing Before (%)": "#ef553b",
+            "Missing After (%)": "#00cc96"
+        }
     )
-    st.plotly_chart(fig, width='stretch')
+    fig.update_layout(height=400, hovermode="x unified", xaxis_tickangle=-45)
+    return fig
+
+@st.fragment
+def _missing_trend_panel(before: tuple, after: tuple):
+    """Trend chart plus its "Advanced chart" toggle.
+
+    A fragment, so flipping the toggle reruns just this panel rather than the
+    whole analytics page.
+    """
+    total = len(before)
+    if total > MAX_CHART_COLUMNS:
+        # keep the columns that were missing the most, in dataset order
+        worst = set(heapq.nlargest(MAX_CHART_COLUMNS, range(total), key=lambda i: before[i][1]))
+        before = tuple(before[i] for i in sorted(worst))
+    if st.checkbox("Advanced chart", key="missing_trend_advanced"):
+        st.plotly_chart(_missing_trend_chart(before, after), width='stretch')
+    else:
+        # Streamlit's built-in Vega-Lite chart is enough for a grouped
+        # bar and avoids shipping a Plotly figure spec on every rerun
+        st.markdown("**Missing Values: Before vs After Cleaning**")
+        after_map = dict(after)
+        st.bar_chart(
+            pd.DataFrame(
+                {
+                    "Missing Before (%)": [p for _, p in before],
+                    "Missing After (%)": [after_map.get(c, 0) for c, _ in before],
+                },
+                index=[c for c, _ in before],
+                dtype=np.float32,
+            ),
+            stack=False,
+            color=["#ef553b", "#00cc96"],
+            x_label="column",
+            y_label="Missing Percentage (%)",
+            height=400,
+            width='stretch'
+        )
+    if len(before) < total:
+        st.caption(_shown_of(len(before), total))
 
 def display_data_issues_report(data):
     """Display comprehensive report of data issues before and after cleaning"""
@@ -466,15 +770,13 @@ def display_data_issues_report(data):
         df_before = pd.DataFrame(before)
         df_after = pd.DataFrame(after)
         
-        merged = pd.merge(
+        merged = _align_on_column(
             df_before[["column", "missing_count", "missing_pct", "dtype", "unique_count"]],
             df_after[["column", "missing_count", "missing_pct"]].rename(columns={
                 "missing_count": "missing_count_after",
                 "missing_pct": "missing_pct_after"
-            }),
-            on="column",
-            how="outer"
-        ).fillna(0)
+            })
+        )
         
         merged["Fixed"] = merged["missing_count"] - merged["missing_count_after"]
         merged["Status"] = merged.apply(
@@ -613,32 +915,34 @@ def display_data_issues_report(data):
 
 def display_downloads(data):
     """Display download links"""
-    cleaned_file = data.get("cleaned_file")
-    report_file = data.get("report_file")
-    json_summary = data.get("json_summary")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if cleaned_file:
-            fn = _basename_posix(cleaned_file)
-            if fn:
-                url = f"{BACKEND_BASE}/api/download?kind=processed&filename={quote(fn)}"
-                st.markdown(f"[📥 Download Cleaned CSV]({url})", unsafe_allow_html=True)
-    
-    with col2:
-        if report_file:
-            fn = _basename_posix(report_file)
-            if fn:
-                url = f"{BACKEND_BASE}/api/download?kind=reports&filename={quote(fn)}"
-                st.markdown(f"[📄 Download PDF Report]({url})", unsafe_allow_html=True)
+    files = []
+    for col, (key, kind, label, mime) in zip(st.columns(3), _DOWNLOAD_LINKS):
+        # the backend returns POSIX paths; skipped artifacts come back as null
+        fn = PurePosixPath(data.get(key) or "").name
+        if fn:
+            files.append((kind, fn))
+            with col:
+                # Bytes are fetched only when clicked; "ignore" keeps the click
+                # from rerunning the script, which would clear these results
+                st.download_button(
+                    label,
+                    data=functools.partial(_fetch_artifact, kind, fn),
+                    file_name=fn,
+                    mime=mime,
+                    on_click="ignore",
+                    key=f"download_{key}"
+                )
     
-    with col3:
-        if json_summary:
-            fn = _basename_posix(json_summary)
-            if fn:
-                url = f"{BACKEND_BASE}/api/download?kind=reports&filename={quote(fn)}"
-                st.markdown(f"[📊 Download JSON Summary]({url})", unsafe_allow_html=True)
+    if len(files) > 1:
+        # everything in one request rather than one per file
+        st.download_button(
+            "📦 Download All (zip)",
+            data=functools.partial(_fetch_bundle, tuple(files)),
+            file_name=f"{PurePosixPath(files[0][1]).stem}_all.zip",
+            mime="application/zip",
+            on_click="ignore",
+            key="download_bundle"
+        )
 
 # Page: Upload & Clean
 if page == "Upload & Clean":
@@ -701,6 +1005,10 @@ if page == "Upload & Clean":
     )
     
     if uploaded_file is not None:
+        # The upload's bytes, taken once for the preview, the column stats and
+        # the backend call
+        payload = uploaded_file.getvalue()
+        
         # File information
         col1, col2, col3 = st.columns(3)
         
@@ -710,34 +1018,33 @@ if page == "Upload & Clean":
         with col2:
             st.metric("💾 File Size", f"{uploaded_file.size / 1024:.1f} KB")
         
+        try:
+            shape, head_df = _preview_csv(payload)
+            preview_error = None
+        except Exception as e:
+            shape = None
+            preview_error = e
+        
         with col3:
-            try:
-                preview_df = pd.read_csv(uploaded_file)
-                st.metric("📊 Dimensions", f"{preview_df.shape[0]} × {preview_df.shape[1]}")
-            except:
+            if shape:
+                st.metric("📊 Dimensions", f"{shape[0]} × {shape[1]}")
+            else:
                 st.metric("📊 Dimensions", "Error")
         
         st.markdown("---")
         
         # Show file preview
         with st.expander("👀 Preview File (First 10 Rows)", expanded=True):
-            try:
-                uploaded_file.seek(0)  # Reset file pointer to beginning
-                preview_df = pd.read_csv(uploaded_file)
-                st.dataframe(preview_df.head(10), width='stretch')
+            if preview_error is None:
+                st.dataframe(head_df, width='stretch')
                 
-                with st.expander("📋 Column Information"):
-                    col_info = []
-                    for col in preview_df.columns:
-                        col_info.append({
-                            "Column": col,
-                            "Type": str(preview_df[col].dtype),
-                            "Missing": preview_df[col].isna().sum(),
-                            "Unique": preview_df[col].nunique()
-                        })
-                    st.dataframe(pd.DataFrame(col_info), width='stretch', hide_index=True)
-            except Exception as e:
-                st.error(f"❌ Error reading file: {e}")
+                # Column stats need a full parse, so only on request
+                if st.checkbox("📋 Show column information", key="preview_column_info"):
+                    with st.spinner("Profiling columns..."):
+                        col_info_df = _column_info(payload)
+                    st.dataframe(col_info_df, width='stretch', hide_index=True)
+            else:
+                st.error(f"❌ Error reading file: {preview_error}")
         
         st.markdown("---")
         
@@ -760,7 +1067,7 @@ if page == "Upload & Clean":
         
         # Process button
         if st.button("🔄 Process & Clean", width='stretch', type="primary"):
-            result = process_file(uploaded_file)
+            result = process_file(uploaded_file.name, payload)
             
             if result:
                 st.success("✅ Processing complete!")
@@ -846,30 +1153,30 @@ elif page == "Analytics":
         if st.session_state.last_result:
             data = st.session_state.last_result
             summary = data.get("summary", {})
+            original = summary.get("original_rows", 0)
+            cleaned = summary.get("cleaned_rows", 0)
+            duplicates = summary.get("dropped_duplicates", 0)
+            missing_before = summary.get("missing_before", 0)
+            missing_after = summary.get("missing_after", 0)
             
             # ========== TOP METRICS SECTION ==========
             st.subheader("📊 Key Metrics Overview")
             metric_cols = st.columns(5)
             
             with metric_cols[0]:
-                st.metric("📥 Original Rows", f"{summary.get('original_rows', 0):,}")
+                st.metric("📥 Original Rows", f"{original:,}")
             
             with metric_cols[1]:
-                st.metric("✅ Cleaned Rows", f"{summary.get('cleaned_rows', 0):,}")
+                st.metric("✅ Cleaned Rows", f"{cleaned:,}")
             
             with metric_cols[2]:
                 st.metric("📋 Total Columns", f"{summary.get('columns', 0)}")
             
             with metric_cols[3]:
-                missing_before = summary.get("missing_before", 0)
-                missing_after = summary.get("missing_after", 0)
                 st.metric("🩹 Issues Fixed", f"{missing_before - missing_after:,}")
             
             with metric_cols[4]:
-                improvement = 0
-                if summary.get("missing_before", 0) > 0:
-                    improvement = ((summary.get("missing_before", 0) - summary.get("missing_after", 0)) / summary.get("missing_before", 0)) * 100
-                st.metric("⬆️ Quality Improvement", f"{improvement:.1f}%")
+                st.metric("⬆️ Quality Improvement", f"{_improvement_pct(summary):.1f}%")
             
             st.markdown("---")
             
@@ -880,53 +1187,21 @@ elif page == "Analytics":
             
             with col1:
                 st.write("**Data Loss Overview**")
-                before_total = summary.get("missing_before", 0)
-                after_total = summary.get("missing_after", 0)
                 
-                if before_total > 0:
-                    fixed = before_total - after_total
-                    improvement_pct = (fixed / before_total) * 100
-                    fig = go.Figure(data=[
-                        go.Pie(
-                            labels=["Fixed", "Remaining"],
-                            values=[fixed, after_total],
-                            hole=0.4,
-                            marker=dict(colors=["#00cc96", "#ef553b"]),
-                            hovertemplate="<b>%{label}</b><br>Count: %{value}<br>%{percent}<extra></extra>"
-                        )
-                    ])
-                    fig.update_layout(height=400, margin=dict(l=0, r=0, t=30, b=0))
+                if missing_before > 0:
+                    fig = _loss_pie_chart(missing_before - missing_after, missing_after)
                     st.plotly_chart(fig, width='stretch')
                 else:
                     st.info("No missing values to fix")
             
             with col2:
                 st.write("**Row Statistics**")
-                original = summary.get("original_rows", 0)
-                duplicates = summary.get("dropped_duplicates", 0)
-                cleaned = summary.get("cleaned_rows", 0)
-                
                 # Show row progression through cleaning stages
-                rows_data = {
-                    "Stage": ["Original Data", "After Duplicate Removal", "Final Cleaned"],
-                    "Rows": [original, original - duplicates, cleaned]
-                }
-                df_rows = pd.DataFrame(rows_data)
-                
-                fig = px.bar(
-                    df_rows,
-                    x="Stage",
-                    y="Rows",
-                    text="Rows",
-                    color="Stage",
-                    color_discrete_sequence=["#667eea", "#ef553b", "#00cc96"]
-                )
-                fig.update_traces(textposition='outside')
-                fig.update_layout(height=400, showlegend=False, 
-                                 yaxis_title="Row Count",
-                                 xaxis_title="",
-                                 margin=dict(l=0, r=0, t=30, b=0))
-                st.plotly_chart(fig, width='stretch')
+                if original or duplicates or cleaned:
+                    fig = _row_stages_chart(original, original - duplicates, cleaned)
+                    st.plotly_chart(fig, width='stretch')
+                else:
+                    st.info("No row data")
             
             with col3:
                 st.write("**Column Types**")
@@ -934,18 +1209,7 @@ elif page == "Analytics":
                 categorical = summary.get("categorical_cols", 0)
                 
                 if numeric + categorical > 0:
-                    fig = go.Figure(data=[
-                        go.Bar(
-                            x=["Numeric", "Categorical"],
-                            y=[numeric, categorical],
-                            text=[numeric, categorical],
-                            textposition='outside',
-                            marker=dict(color=["#00cc96", "#667eea"])
-                        )
-                    ])
-                    fig.update_layout(height=400, showlegend=False, 
-                                     xaxis_title="", yaxis_title="Count",
-                                     margin=dict(l=0, r=0, t=30, b=0))
+                    fig = _column_types_chart(numeric, categorical)
                     st.plotly_chart(fig, width='stretch')
             
             st.markdown("---")
@@ -957,39 +1221,26 @@ elif page == "Analytics":
             after_list = summary.get("missing_summary_after", [])
             
             if before_list and after_list:
+                # (column, missing %) pairs, pulled out of the summaries once;
+                # the trend panel and both completeness charts all read these
+                before_pct = tuple((d["column"], d["missing_pct"]) for d in before_list)
+                after_pct = tuple((d["column"], d["missing_pct"]) for d in after_list)
+                
                 df_before = pd.DataFrame(before_list)
                 df_after = pd.DataFrame(after_list)
                 
-                # Merge data for comparison
-                merged = pd.merge(
+                # Align data for comparison on the column name
+                merged = _align_on_column(
                     df_before[["column", "missing_pct", "dtype", "unique_count"]].rename(
                         columns={"missing_pct": "Missing Before (%)"}
                     ),
                     df_after[["column", "missing_pct"]].rename(
                         columns={"missing_pct": "Missing After (%)"}
-                    ),
-                    on="column",
-                    how="outer"
-                ).fillna(0)
+                    )
+                )
                 
                 # 1. Missing Value Trend Chart
-                fig_missing = px.bar(
-                    merged.melt(id_vars=["column"], 
-                               value_vars=["Missing Before (%)", "Missing After (%)"]),
-                    x="column",
-                    y="value",
-                    color="variable",
-                    labels={"value": "Missing Percentage (%)", "variable": "Stage"},
-                    title="Missing Values: Before vs After Cleaning",
-                    barmode="group",
-                    color_discrete_map={
-                        "Missing Before (%)": "#ef553b",
-                        "Missing After (%)": "#00cc96"
-                    }
-                )
-                fig_missing.update_layout(height=400, hovermode="x unified",
-                                         xaxis_tickangle=-45)
-                st.plotly_chart(fig_missing, width='stretch')
+                _missing_trend_panel(before_pct, after_pct)
                 
                 # 2. Detailed Column Stats Table
                 with st.expander("📋 Detailed Column Statistics"):
@@ -1010,20 +1261,9 @@ elif page == "Analytics":
                     )
                 
                 # 3. Data Quality Score by Column
-                merged["Quality Score"] = 100 - merged["Missing After (%)"]
-                
-                fig_quality = px.bar(
-                    merged.sort_values("Quality Score"),
-                    x="Quality Score",
-                    y="column",
-                    orientation="h",
-                    color="Quality Score",
-                    color_continuous_scale="RdYlGn",
-                    range_color=[0, 100],
-                    title="Data Quality Score by Column",
-                    labels={"column": "Column", "Quality Score": "Quality Score (%)"}
+                fig_quality = _quality_score_chart(
+                    tuple(merged["column"]), tuple(100 - merged["Missing After (%)"])
                 )
-                fig_quality.update_layout(height=400)
                 st.plotly_chart(fig_quality, width='stretch')
             
             st.markdown("---")
@@ -1038,60 +1278,14 @@ elif page == "Analytics":
                 # BEFORE cleaning
                 with col_before:
                     st.write("**Before Cleaning**")
-                    heatmap_data_before = []
-                    for col_info in before_list:
-                        col_name = col_info.get("column", "")
-                        missing_pct = col_info.get("missing_pct", 0)
-                        completeness = 100 - missing_pct
-                        heatmap_data_before.append({
-                            "Column": col_name,
-                            "Completeness (%)": completeness
-                        })
-                    
-                    if heatmap_data_before:
-                        df_heatmap_before = pd.DataFrame(heatmap_data_before)
-                        fig_before = px.bar(
-                            df_heatmap_before.sort_values("Completeness (%)", ascending=True),
-                            x="Completeness (%)",
-                            y="Column",
-                            orientation="h",
-                            color="Completeness (%)",
-                            color_continuous_scale="RdYlGn",
-                            range_color=[0, 100],
-                            text="Completeness (%)"
-                        )
-                        fig_before.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-                        fig_before.update_layout(height=400, xaxis_title="Completeness (%)")
-                        st.plotly_chart(fig_before, width='stretch')
+                    fig_before = _completeness_chart(_completeness(before_pct))
+                    st.plotly_chart(fig_before, width='stretch')
                 
                 # AFTER cleaning
                 with col_after:
                     st.write("**After Cleaning**")
-                    heatmap_data_after = []
-                    for col_info in after_list:
-                        col_name = col_info.get("column", "")
-                        missing_pct = col_info.get("missing_pct", 0)
-                        completeness = 100 - missing_pct
-                        heatmap_data_after.append({
-                            "Column": col_name,
-                            "Completeness (%)": completeness
-                        })
-                    
-                    if heatmap_data_after:
-                        df_heatmap_after = pd.DataFrame(heatmap_data_after)
-                        fig_after = px.bar(
-                            df_heatmap_after.sort_values("Completeness (%)", ascending=True),
-                            x="Completeness (%)",
-                            y="Column",
-                            orientation="h",
-                            color="Completeness (%)",
-                            color_continuous_scale="RdYlGn",
-                            range_color=[0, 100],
-                            text="Completeness (%)"
-                        )
-                        fig_after.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-                        fig_after.update_layout(height=400, xaxis_title="Completeness (%)")
-                        st.plotly_chart(fig_after, width='stretch')
+                    fig_after = _completeness_chart(_completeness(after_pct))
+                    st.plotly_chart(fig_after, width='stretch')
         else:
             st.info("📤 Upload and process a file first to see analytics")
         
@@ -1115,7 +1309,14 @@ elif page == "Analytics":
             4. Use JSON summary for programmatic access
             """)
 elif page == "Processing History":
-    st.header("Processing History")
+    head_col, refresh_col = st.columns([5, 1])
+    with head_col:
+        st.header("Processing History")
+    with refresh_col:
+        if st.button("🔄 Refresh", key="history_refresh", help="Fetch the latest runs from the backend"):
+            # a new cache key for this session only; other users' cached
+            # runs are left alone
+            st.session_state.history_refreshes = st.session_state.get("history_refreshes", 0) + 1
     
     hist_tab1, hist_tab2 = st.tabs(["History", "About"])
     
@@ -1141,134 +1342,123 @@ elif page == "Processing History":
     
     with hist_tab1:
         try:
-            resp = requests.get(
-                f"{BACKEND_BASE}/api/runs?limit=20",
-                headers=_auth_headers(),
-                timeout=10,
-            )
-            if resp.status_code == 200:
-                history_data = resp.json()
-                runs = history_data.get("runs", [])
+            with st.spinner("Loading history..."):
+                history_data = _fetch_runs(
+                    20,
+                    st.session_state.get("token"),
+                    st.session_state.get("history_refreshes", 0),
+                )
+            runs = history_data.get("runs", [])
+            
+            if runs:
+                # Statistics
+                st.markdown(f"**📈 Statistics**: {len(runs)} processing runs found")
+                run_summaries = [r.get("summary", {}) for r in runs]
                 
-                if runs:
-                    # Statistics
-                    st.markdown(f"**📈 Statistics**: {len(runs)} processing runs found")
-                    
-                    stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
-                    
-                    with stat_col1:
-                        total_rows = sum([r.get("summary", {}).get("cleaned_rows", 0) for r in runs])
-                        st.metric("✅ Total Cleaned Rows", f"{total_rows:,}")
-                    
-                    with stat_col2:
-                        total_duplicates = sum([r.get("summary", {}).get("dropped_duplicates", 0) for r in runs])
-                        st.metric("🗑️ Total Duplicates Removed", f"{total_duplicates:,}")
-                    
-                    with stat_col3:
-                        total_missing_fixed = sum([
-                            r.get("summary", {}).get("missing_before", 0) - r.get("summary", {}).get("missing_after", 0)
-                            for r in runs
-                        ])
-                        st.metric("🩹 Total Issues Fixed", f"{total_missing_fixed:,}")
-                    
-                    with stat_col4:
-                        improvements = []
-                        for r in runs:
-                            s = r.get("summary", {})
-                            mb = s.get("missing_before", 0) or 0
-                            ma = s.get("missing_after", 0) or 0
-                            if mb > 0 and ma <= mb:
-                                improvements.append(((mb - ma) / mb) * 100)
+                stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
+                
+                with stat_col1:
+                    total_rows = sum(s.get("cleaned_rows", 0) for s in run_summaries)
+                    st.metric("✅ Total Cleaned Rows", f"{total_rows:,}")
+                
+                with stat_col2:
+                    total_duplicates = sum(s.get("dropped_duplicates", 0) for s in run_summaries)
+                    st.metric("🗑️ Total Duplicates Removed", f"{total_duplicates:,}")
+                
+                with stat_col3:
+                    total_missing_fixed = sum(
+                        s.get("missing_before", 0) - s.get("missing_after", 0)
+                        for s in run_summaries
+                    )
+                    st.metric("🩹 Total Issues Fixed", f"{total_missing_fixed:,}")
+                
+                with stat_col4:
+                    improvements = []
+                    for s in run_summaries:
+                        mb = s.get("missing_before", 0) or 0
+                        ma = s.get("missing_after", 0) or 0
+                        if mb > 0 and ma <= mb:
+                            improvements.append(((mb - ma) / mb) * 100)
 
-                        if improvements:
-                            avg_improvement = sum(improvements) / len(improvements)
-                            st.metric("📊 Average Quality Improvement", f"{avg_improvement:.1f}%")
-                        else:
-                            st.metric("📊 Average Quality Improvement", "N/A")
+                    if improvements:
+                        avg_improvement = sum(improvements) / len(improvements)
+                        st.metric("📊 Average Quality Improvement", f"{avg_improvement:.1f}%")
+                    else:
+                        st.metric("📊 Average Quality Improvement", "N/A")
+                
+                st.markdown("---")
+                
+                # Filtering options
+                filter_col1, filter_col2 = st.columns(2)
+                
+                with filter_col1:
+                    limit = st.select_slider(
+                        "Rows to display",
+                        options=[5, 10, 20, 50],
+                        value=20
+                    )
+                
+                with filter_col2:
+                    sort_by = st.selectbox(
+                        "Sort by",
+                        ["Most Recent", "Oldest First", "Largest File"],
+                        index=0
+                    )
+                
+                st.markdown("---")
+                
+                # Create history dataframe with detailed information,
+                # built column by column rather than from per-row dicts
+                shown_runs = runs[:limit]
+                summaries = [run.get("summary", {}) for run in shown_runs]
+                history_cols = {
+                    "📄 File Name": [run.get("uploaded_filename", "Unknown") for run in shown_runs],
+                    "🔑 Run ID": [run.get("run_id", "N/A")[:12] for run in shown_runs],
+                    "📥 Original Rows": [f"{s.get('original_rows', 0):,}" for s in summaries],
+                    "✅ Cleaned Rows": [f"{s.get('cleaned_rows', 0):,}" for s in summaries],
+                    "🗑️ Duplicates": [s.get("dropped_duplicates", 0) for s in summaries],
+                    "📊 Columns": [s.get("columns", 0) for s in summaries],
+                    "⬆️ Quality Improvement": [f"{_improvement_pct(s):.1f}%" for s in summaries],
+                }
+                
+                if shown_runs:
+                    df_history = pd.DataFrame(history_cols)
+                    st.dataframe(df_history, width='stretch', hide_index=True)
                     
                     st.markdown("---")
                     
-                    # Filtering options
-                    filter_col1, filter_col2 = st.columns(2)
-                    
-                    with filter_col1:
-                        limit = st.select_slider(
-                            "Rows to display",
-                            options=[5, 10, 20, 50],
-                            value=20
-                        )
-                    
-                    with filter_col2:
-                        sort_by = st.selectbox(
-                            "Sort by",
-                            ["Most Recent", "Oldest First", "Largest File"],
-                            index=0
+                    # Detailed view option
+                    with st.expander("🔍 View Detailed Information"):
+                        selected_run_idx = st.selectbox(
+                            "Select a run to view details",
+                            range(min(len(runs), limit)),
+                            format_func=lambda i: f"{runs[i].get('uploaded_filename', 'Unknown')} - {runs[i].get('run_id', '')[:8]}"
                         )
-                    
-                    st.markdown("---")
-                    
-                    # Create history dataframe with detailed information
-                    history_list = []
-                    for run in runs[:limit]:
-                        summary = run.get("summary", {})
-                        orig_rows = summary.get("original_rows", 0)
-                        cleaned_rows = summary.get("cleaned_rows", 0)
-                        
-                        # Calculate quality improvement
-                        missing_before = summary.get("missing_before", 0)
-                        missing_after = summary.get("missing_after", 0)
-                        improvement = 0
-                        if missing_before > 0:
-                            improvement = ((missing_before - missing_after) / missing_before) * 100
-                        
-                        history_list.append({
-                            "📄 File Name": run.get("uploaded_filename", "Unknown"),
-                            "🔑 Run ID": run.get("run_id", "N/A")[:12],
-                            "📥 Original Rows": f"{orig_rows:,}",
-                            "✅ Cleaned Rows": f"{cleaned_rows:,}",
-                            "🗑️ Duplicates": summary.get("dropped_duplicates", 0),
-                            "📊 Columns": summary.get("columns", 0),
-                            "⬆️ Quality Improvement": f"{improvement:.1f}%"
-                        })
-                    
-                    if history_list:
-                        df_history = pd.DataFrame(history_list)
-                        st.dataframe(df_history, width='stretch', hide_index=True)
-                        
-                        st.markdown("---")
                         
-                        # Detailed view option
-                        with st.expander("🔍 View Detailed Information"):
-                            selected_run_idx = st.selectbox(
-                                "Select a run to view details",
-                                range(min(len(runs), limit)),
-                                format_func=lambda i: f"{runs[i].get('uploaded_filename', 'Unknown')} - {runs[i].get('run_id', '')[:8]}"
-                            )
+                        if selected_run_idx is not None and selected_run_idx < len(runs):
+                            selected_run = runs[selected_run_idx]
+                            summary = selected_run.get("summary", {})
                             
-                            if selected_run_idx is not None and selected_run_idx < len(runs):
-                                selected_run = runs[selected_run_idx]
-                                summary = selected_run.get("summary", {})
-                                
-                                st.write("**Run Details**")
-                                detail_col1, detail_col2 = st.columns(2)
-                                
-                                with detail_col1:
-                                    st.write(f"📄 **File**: {selected_run.get('uploaded_filename', 'Unknown')}")
-                                    st.write(f"🔑 **Run ID**: {selected_run.get('run_id', 'N/A')}")
-                                    st.write(f"📊 **Original Rows**: {summary.get('original_rows', 'N/A'):,}")
-                                    st.write(f"✅ **Cleaned Rows**: {summary.get('cleaned_rows', 'N/A'):,}")
-                                
-                                with detail_col2:
-                                    st.write(f"🗑️ **Duplicates Removed**: {summary.get('dropped_duplicates', 0)}")
-                                    st.write(f"📋 **Total Columns**: {summary.get('columns', 0)}")
-                                    st.write(f"📭 **Missing Values Fixed**: {summary.get('missing_before', 0) - summary.get('missing_after', 0):,}")
-                                    st.write(f"📋 **Numeric Columns**: {summary.get('numeric_cols', 0)}")
-                    else:
-                        st.info("No processing history found")
+                            st.write("**Run Details**")
+                            detail_col1, detail_col2 = st.columns(2)
+                            
+                            with detail_col1:
+                                st.write(f"📄 **File**: {selected_run.get('uploaded_filename', 'Unknown')}")
+                                st.write(f"🔑 **Run ID**: {selected_run.get('run_id', 'N/A')}")
+                                st.write(f"📊 **Original Rows**: {summary.get('original_rows', 'N/A'):,}")
+                                st.write(f"✅ **Cleaned Rows**: {summary.get('cleaned_rows', 'N/A'):,}")
+                            
+                            with detail_col2:
+                                st.write(f"🗑️ **Duplicates Removed**: {summary.get('dropped_duplicates', 0)}")
+                                st.write(f"📋 **Total Columns**: {summary.get('columns', 0)}")
+                                st.write(f"📭 **Missing Values Fixed**: {summary.get('missing_before', 0) - summary.get('missing_after', 0):,}")
+                                st.write(f"📋 **Numeric Columns**: {summary.get('numeric_cols', 0)}")
                 else:
-                    st.info("📭 No processing history found. Upload and process a file to get started.")
+                    st.info("No processing history found")
             else:
-                st.warning("⚠️ Could not fetch history from backend")
+                st.info("📭 No processing history found. Upload and process a file to get started.")
+        except requests.exceptions.HTTPError:
+            st.warning("⚠️ Could not fetch history from backend")
         except Exception as e:
             st.error(f"❌ Error fetching history: {e}")
         
@@ -1309,7 +1499,7 @@ elif page == "Settings":
         with col1:
             st.markdown("**Backend Status**")
             try:
-                resp = requests.get(
+                resp = http_session().get(
                     f"{BACKEND_BASE}/api/runs?limit=1",
                     headers=_auth_headers(),
                     timeout=5,
@@ -10,19 +10,19 @@ from flask import Flask, render_template, request, jsonify, send_file, session
 from werkzeug.utils import secure_filename
 import pandas as pd
 import requests
+from urllib3.filepost import choose_boundary
 import json
-import os
 from pathlib import Path
 from datetime import datetime
 import io
 
+from backend_client import BACKEND_BASE, http_session, multipart_body
+
 app = Flask(__name__, template_folder="templates", static_folder="static")
 app.secret_key = "cleandatapro_secret_key_2024"
 app.config["MAX_CONTENT_LENGTH"] = 100 * 1024 * 1024  # 100MB max file size
 app.config["UPLOAD_FOLDER"] = "temp_uploads"
 
-BACKEND_BASE = os.environ.get("CLEAN_DATAPRO_BACKEND", "http://localhost:8000")
-
 # Ensure upload folder exists
 Path(app.config["UPLOAD_FOLDER"]).mkdir(parents=True, exist_ok=True)
 
@@ -87,9 +87,14 @@ def process():
     file = request.files["file"]
     
     try:
-        # Call backend API
-        files = {"file": (file.filename, file.getvalue(), "text/csv")}
-        resp = requests.post(f"{BACKEND_BASE}/api/process", files=files, timeout=60)
+        # Call backend API, streaming the upload through in chunks
+        boundary = choose_boundary()
+        resp = http_session().post(
+            f"{BACKEND_BASE}/api/process",
+            data=multipart_body(file.filename, file.stream, boundary),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            timeout=60,
+        )
         
         if resp.status_code != 200:
             return jsonify({"error": f"Backend error: {resp.text}"}), 500
@@ -117,7 +122,7 @@ def process():
 def get_history():
     """Fetch processing history from backend"""
     try:
-        resp = requests.get(f"{BACKEND_BASE}/api/runs?limit=50", timeout=10)
+        resp = http_session().get(f"{BACKEND_BASE}/api/runs?limit=50", timeout=10)
         if resp.status_code == 200:
             return jsonify(resp.json())
         else:
@@ -130,7 +135,7 @@ def get_history():
 def test_backend():
     """Test backend connection"""
     try:
-        resp = requests.get(f"{BACKEND_BASE}/api/runs?limit=1", timeout=5)
+        resp = http_session().get(f"{BACKEND_BASE}/api/runs?limit=1", timeout=5)
         if resp.status_code == 200:
             return jsonify({"success": True, "message": "Backend is online"})
         else:
@@ -152,7 +157,7 @@ def download_file(kind, filename):
     """Download file from backend"""
     try:
         url = f"{BACKEND_BASE}/api/download?kind={kind}&filename={filename}"
-        resp = requests.get(url, timeout=30)
+        resp = http_session().get(url, timeout=30)
         
         if resp.status_code == 200:
             return send_file(
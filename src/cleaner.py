@@ -1,30 +1,49 @@
-from typing import List, Any
+from typing import List, Any, Callable, Dict
 import pandas as pd
 import numpy as np
 
 
+def _converter_for(t: type) -> Callable[[Any], Any]:
+    """Pick the conversion for values of type `t` (subclasses included)."""
+    if issubclass(t, np.integer):
+        return int
+    elif issubclass(t, np.floating):
+        return float
+    elif issubclass(t, np.ndarray):
+        return np.ndarray.tolist
+    elif issubclass(t, dict):
+        return lambda obj: {k: _convert_numpy_types(v) for k, v in obj.items()}
+    elif issubclass(t, (list, tuple)):
+        return lambda obj: [_convert_numpy_types(item) for item in obj]
+    elif issubclass(t, pd.Series):
+        return pd.Series.to_list
+    elif issubclass(t, pd.DataFrame):
+        return lambda obj: obj.to_dict(orient="records")
+    else:
+        return _identity
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+# Converter per concrete type, resolved once so each value costs one dict lookup
+_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    t: _identity for t in (str, int, float, bool, type(None))
+}
+
+
 def _convert_numpy_types(obj: Any) -> Any:
     """Recursively convert numpy types to native Python types for JSON serialization."""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {k: _convert_numpy_types(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [_convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, pd.Series):
-        return obj.to_list()
-    elif isinstance(obj, pd.DataFrame):
-        return obj.to_dict(orient="records")
-    else:
-        return obj
+    t = type(obj)
+    convert = _CONVERTERS.get(t)
+    if convert is None:
+        convert = _CONVERTERS[t] = _converter_for(t)
+    return convert(obj)
 
 
 # Common placeholder values that should be treated as missing data
-PLACEHOLDER_VALUES = {
+PLACEHOLDER_VALUES = frozenset({
     "unknown",
     "n/a",
     "na",
@@ -41,7 +60,7 @@ PLACEHOLDER_VALUES = {
     "?",
     "n.a.",
     "#n/a",
-}
+})
 
 
 def _is_missing_value(val: Any) -> bool:
@@ -58,39 +77,67 @@ def _is_missing_value(val: Any) -> bool:
     return False
 
 
+def _can_hold_placeholders(s: pd.Series) -> bool:
+    """Placeholders are strings, so only text-like columns can contain them."""
+    return s.dtype == object or isinstance(s.dtype, (pd.CategoricalDtype, pd.StringDtype))
+
+
+def _missing_mask(s: pd.Series) -> pd.Series:
+    """Vectorized `_is_missing_value` over a whole column."""
+    mask = s.isna()
+    # Placeholders can only live in text (object/string/category) columns
+    if _can_hold_placeholders(s):
+        # Strip/lowercase each distinct value once rather than every row
+        codes, uniques = pd.factorize(s)
+        try:
+            lowered = pd.Series(uniques, dtype=object).str.strip().str.lower()
+        except AttributeError:
+            # .str refuses object columns without any strings in them
+            return mask
+        # Trailing False catches the -1 code factorize gives NaN
+        hits = np.append(lowered.isin(PLACEHOLDER_VALUES).to_numpy(), False)
+        mask |= hits[codes]
+    return mask
+
+
 def _is_numeric_column(s: pd.Series) -> bool:
     """Detect if a column should be numeric by checking non-missing values."""
-    non_missing = s[~s.apply(lambda x: _is_missing_value(x))]
+    non_missing = s[~_missing_mask(s)]
     
     if non_missing.empty:
         return False
     
-    # Try to convert to numeric
-    numeric_count = 0
-    for val in non_missing:
-        try:
-            float(val)
-            numeric_count += 1
-        except (ValueError, TypeError):
-            pass
+    # Try to convert to numeric (unparseable values become NaN)
+    numeric_ratio = pd.to_numeric(non_missing, errors="coerce").notna().mean()
     
     # If majority (>80%) of non-missing values are numeric, treat as numeric column
-    return numeric_count / len(non_missing) > 0.8 if non_missing.shape[0] > 0 else False
+    return bool(numeric_ratio > 0.8)
 
 
 def _replace_placeholders(df: pd.DataFrame) -> pd.DataFrame:
     """Replace placeholder values with actual NaN so they can be properly filled."""
-    working = df.copy()
+    cols = {}
     
-    for col in working.columns:
-        s = working[col]
-        # Only process object (string) columns for placeholder replacement
-        if s.dtype == object:
+    for col, s in df.items():
+        # Only process text columns for placeholder replacement
+        if _can_hold_placeholders(s):
             # Replace placeholder strings with NaN
-            mask = s.apply(lambda x: _is_missing_value(x) if isinstance(x, str) else False)
-            working.loc[mask, col] = np.nan
+            s = s.mask(_missing_mask(s))
+        cols[col] = s
     
-    return working
+    # Build the frame once instead of reassigning columns one by one
+    return pd.DataFrame(cols, index=df.index)
+
+
+def _sample_values(non_missing: pd.Series, top_values: int) -> List[Any]:
+    """First `top_values` distinct values in order of appearance (compared as str)."""
+    # Distinct values usually show up early, so try a small window first and
+    # only dedupe the whole column when the window comes up short
+    for window in (non_missing.head(10 * top_values), non_missing):
+        firsts = window[~window.astype(str).duplicated()]
+        if len(firsts) >= top_values or len(window) == len(non_missing):
+            return firsts.head(top_values).tolist()
+    return []
 
 
 def analyze_missing_summary(df: pd.DataFrame, top_values: int = 3) -> pd.DataFrame:
@@ -120,25 +167,16 @@ def analyze_missing_summary(df: pd.DataFrame, top_values: int = 3) -> pd.DataFra
     for col in df.columns:
         s = df[col]
         # Count both actual NaN and placeholder values
-        missing = int(s.apply(lambda x: _is_missing_value(x)).sum())
+        mask = _missing_mask(s)
+        missing = int(mask.sum())
         missing_pct = round((missing / total) * 100, 2) if total else 0.0
         dtype = str(s.dtype)
         
         # Count unique non-missing values
-        non_missing = s[~s.apply(lambda x: _is_missing_value(x))]
+        non_missing = s[~mask]
         unique_count = int(non_missing.nunique())
 
-        sample_values: List[Any] = []
-        if not non_missing.empty:
-            # keep order of appearance, but unique
-            seen = set()
-            for v in non_missing.astype(object).tolist():
-                v_str = str(v)
-                if v_str not in seen:
-                    sample_values.append(v)
-                    seen.add(v_str)
-                if len(sample_values) >= top_values:
-                    break
+        sample_values = _sample_values(non_missing, top_values)
 
         rows.append(
             {
@@ -8,6 +8,25 @@ from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
 
+# Built once at import: the sample stylesheet and table style are the same
+# for every report and getSampleStyleSheet() is not cheap
+_STYLES = getSampleStyleSheet()
+_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#003f5c")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("ALIGN", (1, 1), (-2, -1), "RIGHT"),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+    ]
+)
+
+
 def generate_pdf_report(
     summary_df: pd.DataFrame,
     output_path: str,
@@ -29,7 +48,7 @@ def generate_pdf_report(
             generated_by: optional author or runner info
     """
     doc = SimpleDocTemplate(output_path, pagesize=letter)
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     elements = []
 
     # Title
@@ -75,21 +94,7 @@ def generate_pdf_report(
     # Table styling
     col_widths = [120, 60, 70, 70, 60, 160]
     table = Table(data, colWidths=col_widths, repeatRows=1)
-    style = TableStyle(
-        [
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#003f5c")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("ALIGN", (1, 1), (-2, -1), "RIGHT"),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-            ("FONTSIZE", (0, 0), (-1, -1), 9),
-            ("LEFTPADDING", (0, 0), (-1, -1), 6),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-        ]
-    )
-    table.setStyle(style)
+    table.setStyle(_TABLE_STYLE)
 
     elements.append(table)
 
@@ -0,0 +1,25 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# The repo root, so tests can import the backend as `backend.src` next to the
+# root-level `src` package without the two clashing
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def serve_dirs(tmp_path: Path, monkeypatch):
+    """Point the download routes at empty processed/ and reports/ dirs."""
+    from backend.src.routes import files
+
+    dirs = {}
+    for kind in ("processed", "reports"):
+        d = tmp_path / kind
+        d.mkdir()
+        dirs[kind] = (d, str(d.resolve()) + os.sep)
+    monkeypatch.setattr(files, "SERVE_DIRS_RESOLVED", dirs)
+    return {kind: d for kind, (d, _) in dirs.items()}
@@ -0,0 +1,65 @@
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from backend.src import auth
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    auth._TOKEN_CACHE.clear()
+    yield
+    auth._TOKEN_CACHE.clear()
+
+
+def _token(email: str, exp: float) -> str:
+    return jwt.encode({"email": email, "exp": exp}, auth._SECRET_KEY_BYTES, algorithm=auth.ALGORITHM)
+
+
+def test_valid_token_is_cached_for_the_ttl():
+    token = auth.create_access_token("a@example.com")
+    before = time.monotonic()
+    assert auth.verify_token(token) == "a@example.com"
+    expires, email = auth._TOKEN_CACHE[token]
+    assert email == "a@example.com"
+    assert before + auth.TOKEN_CACHE_TTL <= expires <= time.monotonic() + auth.TOKEN_CACHE_TTL
+
+
+def test_cache_ttl_is_clamped_to_token_expiry():
+    token = _token("a@example.com", time.time() + 1.0)
+    assert auth.verify_token(token) == "a@example.com"
+    expires, _ = auth._TOKEN_CACHE[token]
+    assert expires <= time.monotonic() + 1.0
+
+
+def test_expired_token_is_rejected_while_cached():
+    exp = time.time() + 1.0
+    token = _token("a@example.com", exp)
+    assert auth.verify_token(token) == "a@example.com"
+
+    time.sleep(max(exp - time.time(), 0) + 0.05)
+    # still in the cache, well within TOKEN_CACHE_TTL of the first check
+    assert token in auth._TOKEN_CACHE
+    assert auth.verify_token(token) is None
+    assert auth._TOKEN_CACHE[token][1] is None
+
+
+def test_invalid_tokens_are_rejected():
+    expired = auth.create_access_token("a@example.com", expires_delta=timedelta(seconds=-10))
+    forged = jwt.encode({"email": "a@example.com"}, b"other-key", algorithm=auth.ALGORITHM)
+    for token in (expired, forged, "not-a-token"):
+        assert auth.verify_token(token) is None
+        assert auth._TOKEN_CACHE[token][1] is None
+
+
+def test_cache_is_bounded():
+    extra = 50
+    for i in range(auth.TOKEN_CACHE_SIZE + extra):
+        auth.verify_token(f"token-{i}")
+    assert len(auth._TOKEN_CACHE) == auth.TOKEN_CACHE_SIZE
+    # oldest entries go first
+    assert "token-0" not in auth._TOKEN_CACHE
+    assert f"token-{extra}" in auth._TOKEN_CACHE
+    assert f"token-{auth.TOKEN_CACHE_SIZE + extra - 1}" in auth._TOKEN_CACHE
@@ -0,0 +1,100 @@
+import io
+import os
+import tempfile
+import zipfile
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.src.routes import files
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(files.router, prefix="/api")
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest.fixture
+def zip_paths(monkeypatch):
+    """Record the temp files download_bundle creates."""
+    paths = []
+    mkstemp = tempfile.mkstemp
+
+    def recording_mkstemp(*args, **kwargs):
+        fd, path = mkstemp(*args, **kwargs)
+        paths.append(path)
+        return fd, path
+
+    monkeypatch.setattr(files.tempfile, "mkstemp", recording_mkstemp)
+    return paths
+
+
+def test_bundle_zips_requested_files(client, serve_dirs, zip_paths):
+    (serve_dirs["processed"] / "run_cleaned.csv").write_text("a,b\n1,2\n")
+    (serve_dirs["reports"] / "run_report.pdf").write_bytes(b"%PDF-1.4")
+    (serve_dirs["reports"] / "other.pdf").write_bytes(b"%PDF-1.4")
+
+    res = client.get(
+        "/api/download/bundle",
+        params={"processed": ["run_cleaned.csv"], "reports": ["run_report.pdf"]},
+    )
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/zip"
+    assert "cleandatapro_run.zip" in res.headers["content-disposition"]
+    with zipfile.ZipFile(io.BytesIO(res.content)) as zf:
+        assert sorted(zf.namelist()) == ["run_cleaned.csv", "run_report.pdf"]
+        assert zf.read("run_cleaned.csv") == b"a,b\n1,2\n"
+
+    # the background task removes the temp zip once it has been sent
+    assert len(zip_paths) == 1
+    assert not os.path.exists(zip_paths[0])
+
+
+def test_bundle_removes_temp_zip_on_failure(client, serve_dirs, zip_paths, monkeypatch):
+    (serve_dirs["processed"] / "run_cleaned.csv").write_text("a,b\n1,2\n")
+
+    def failing_write(self, *args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(zipfile.ZipFile, "write", failing_write)
+    res = client.get("/api/download/bundle", params={"processed": ["run_cleaned.csv"]})
+    assert res.status_code == 500
+    assert len(zip_paths) == 1
+    assert not os.path.exists(zip_paths[0])
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["../reports/run_report.pdf", "..%2Freports%2Frun_report.pdf", "/etc/passwd"],
+)
+def test_bundle_rejects_path_traversal(client, serve_dirs, zip_paths, filename):
+    (serve_dirs["reports"] / "run_report.pdf").write_bytes(b"%PDF-1.4")
+    res = client.get("/api/download/bundle", params={"processed": [filename]})
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Invalid filename"
+    assert zip_paths == []
+
+
+def test_bundle_missing_file(client, serve_dirs, zip_paths):
+    res = client.get("/api/download/bundle", params={"processed": ["nope.csv"]})
+    assert res.status_code == 404
+    assert zip_paths == []
+
+
+def test_bundle_without_files(client, serve_dirs, zip_paths):
+    res = client.get("/api/download/bundle")
+    assert res.status_code == 400
+    assert res.json()["detail"] == "No files requested"
+    assert zip_paths == []
+
+
+def test_download_rejects_path_traversal(client, serve_dirs):
+    (serve_dirs["reports"] / "run_report.pdf").write_bytes(b"%PDF-1.4")
+    res = client.get(
+        "/api/download",
+        params={"kind": "processed", "filename": "../reports/run_report.pdf"},
+    )
+    assert res.status_code == 400
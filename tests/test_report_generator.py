@@ -1,7 +1,10 @@
 from pathlib import Path
 import pandas as pd
+from reportlab.platypus import LongTable, Paragraph
 from src.report_generator import generate_pdf_report
 
+from backend.src import report_generator as backend_report
+
 
 def test_generate_pdf_report_creates_file(tmp_path: Path):
     sample = pd.DataFrame(
@@ -28,3 +31,49 @@ def test_generate_pdf_report_creates_file(tmp_path: Path):
     assert out.exists()
     # rough sanity: file size should be > 100 bytes
     assert out.stat().st_size > 100
+
+
+def _summary(before_columns, after_columns):
+    return {
+        "missing_summary_before": [
+            {"column": c, "missing_pct": 10.0 * (i + 1)} for i, c in enumerate(before_columns)
+        ],
+        "missing_summary_after": [
+            {"column": c, "missing_pct": 0.0, "dtype": "int64"} for c in after_columns
+        ],
+    }
+
+
+def test_column_rows_keep_before_summary_order():
+    summary = _summary(["zeta", "alpha", "mid"], ["alpha", "extra", "zeta", "mid"])
+    rows, omitted = backend_report._column_rows(
+        summary["missing_summary_before"], summary["missing_summary_after"], max_rows=10
+    )
+    # before-summary order (most affected first), after-only columns last
+    assert [r[0] for r in rows] == ["zeta", "alpha", "mid", "extra"]
+    assert rows[0] == ["zeta", "10.0%", "0.0%", "int64"]
+    assert rows[-1] == ["extra", "%", "0.0%", "int64"]
+    assert omitted == 0
+
+
+def test_column_rows_truncate_at_max_rows():
+    summary = _summary(["c", "b", "a"], ["c", "b", "a", "d"])
+    rows, omitted = backend_report._column_rows(
+        summary["missing_summary_before"], summary["missing_summary_after"], max_rows=2
+    )
+    assert [r[0] for r in rows] == ["c", "b"]
+    assert omitted == 2
+
+
+def test_backend_pdf_report_notes_omitted_columns(tmp_path: Path, monkeypatch):
+    built = []
+    monkeypatch.setattr(
+        backend_report.SimpleDocTemplate, "build", lambda self, flowables: built.extend(flowables)
+    )
+    summary = _summary(["c", "b", "a"], ["c", "b", "a", "d"])
+    backend_report.generate_pdf_report(summary, str(tmp_path / "report.pdf"), max_rows=2)
+
+    tables = [f for f in built if isinstance(f, LongTable)]
+    assert [row[0] for t in tables for row in t._cellvalues[1:]] == ["c", "b"]
+    notes = [f.getPlainText() for f in built if isinstance(f, Paragraph)]
+    assert notes[-1] == "… 2 more columns omitted"
@@ -17,21 +17,24 @@ def get_logger(
     Uses RichHandler for nicer console output when `rich` is installed and
     `use_rich` is True. Falls back to a standard stream handler otherwise.
     """
-    handlers = []
-    if use_rich and RichHandler is not None:
-        handler = RichHandler()
-        handlers.append(handler)
-    else:
-        handler = logging.StreamHandler()
-        handlers.append(handler)
-
-    # configure basic logging using handlers created above
-    fmt = "%(message)s"
-    logging.basicConfig(
-        level=level,
-        format=fmt,
-        handlers=handlers,
-    )
+    # basicConfig is a no-op once the root logger has handlers, so only build
+    # a handler the first time instead of on every call
+    if not logging.getLogger().handlers:
+        handlers = []
+        if use_rich and RichHandler is not None:
+            handler = RichHandler()
+            handlers.append(handler)
+        else:
+            handler = logging.StreamHandler()
+            handlers.append(handler)
+
+        # configure basic logging using handlers created above
+        fmt = "%(message)s"
+        logging.basicConfig(
+            level=level,
+            format=fmt,
+            handlers=handlers,
+        )
 
     logger = logging.getLogger(name)
     logger.setLevel(level)